@@ -8,6 +8,8 @@ import subprocess
 import sys
 from pathlib import Path
 
+CHUNK_SIZE = 1 << 16
+
 def run_conversion(input_path: str, output_dir: str):
     """Run the conversion command with proper error handling"""
     
@@ -22,18 +24,18 @@ def run_conversion(input_path: str, output_dir: str):
     print("-" * 80)
     
     try:
-        # Run with real-time output
+        # Run with real-time output, streaming raw bytes instead of decoding line by line
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
+            bufsize=CHUNK_SIZE
         )
         
-        # Print output in real-time
-        for line in process.stdout:
-            print(line, end='', flush=True)
+        # Print output in real-time; read1 returns whatever is available (up to CHUNK_SIZE)
+        for chunk in iter(lambda: process.stdout.read1(CHUNK_SIZE), b""):
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
         
         # Wait for completion
         return_code = process.wait()
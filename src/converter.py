@@ -4,25 +4,40 @@ Document to Markdown/JSON converter
 Recursively scans directories for PDF, PPTX, DOCX files and converts them to .md and .json
 """
 
-# Force CPU usage to avoid MPS issues on macOS - must be before any imports
+# Force CPU usage to avoid MPS issues on macOS - must be before any imports.
+# PYTORCH_MPS_DISABLED=1 is authoritative; touching torch.backends.mps would load the backend we avoid.
+# Other platforms keep CUDA available for marker and Surya.
 import os
-os.environ["PYTORCH_MPS_DISABLED"] = "1"
-os.environ["PYTORCH_DEVICE"] = "cpu"
-os.environ["CUDA_VISIBLE_DEVICES"] = ""
+import sys
+
+if sys.platform == "darwin":
+    os.environ["PYTORCH_MPS_DISABLED"] = "1"
+    os.environ["PYTORCH_DEVICE"] = "cpu"
+    os.environ["CUDA_VISIBLE_DEVICES"] = ""
 
 import concurrent.futures
+import contextlib
+import functools
+import gc
+import hashlib
+import io
+import itertools
 import json
+import multiprocessing.util
+import posixpath
+import re
+import xml.etree.ElementTree as ET
+import zipfile
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 import click
 import torch
-
-# Disable MPS backend if available
-if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-    torch.backends.mps.enabled = False
 from docx import Document
+from docx.oxml.ns import qn
+from docx.styles import BabelFish
 from marker.converters.pdf import PdfConverter
 from marker.models import create_model_dict
 from marker.output import text_from_rendered
@@ -32,10 +47,67 @@ from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
-from .ocr import OCRManager
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+from .ocr import DEFAULT_OCR_TARGET_HEIGHT, OCRManager
 
 console = Console()
 
+# Source files are hashed in 1 MiB chunks
+_READ_CHUNK_SIZE = 1 << 20
+
+# Content hashes of converted sources, stored in the output directory
+MANIFEST_FILENAME = ".manifest.json"
+
+# Markdown prefixes of Word's built-in heading styles
+_HEADING_PREFIXES = {f"Heading {level}": "#" * level + " " for level in range(1, 10)}
+# WordprocessingML tags read by convert_docx
+_W_P, _W_PPR, _W_PSTYLE = qn("w:p"), qn("w:pPr"), qn("w:pStyle")
+_W_R, _W_RPR, _W_HYPERLINK = qn("w:r"), qn("w:rPr"), qn("w:hyperlink")
+_W_B, _W_I, _W_VAL, _W_TYPE = qn("w:b"), qn("w:i"), qn("w:val"), qn("w:type")
+_W_STYLE, _W_STYLE_ID, _W_NAME, _W_DEFAULT = qn("w:style"), qn("w:styleId"), qn("w:name"), qn("w:default")
+
+# Text of run content elements, matching python-docx's Run.text
+_RUN_CONTENT = {
+    qn("w:t"): lambda e: e.text or "",
+    qn("w:tab"): lambda e: "\t",
+    qn("w:ptab"): lambda e: "\t",
+    qn("w:br"): lambda e: "\n" if e.get(_W_TYPE, "textWrapping") == "textWrapping" else "",
+    qn("w:cr"): lambda e: "\n",
+    qn("w:noBreakHyphen"): lambda e: "-",
+}
+
+# PresentationML/DrawingML tags read by the fast PPTX path
+_A_NS = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P_NS = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_R_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_RT_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+_P_SP, _P_PH, _P_TXBODY = _P_NS + "sp", _P_NS + "ph", _P_NS + "txBody"
+_A_P, _A_R, _A_FLD, _A_BR, _A_T = _A_NS + "p", _A_NS + "r", _A_NS + "fld", _A_NS + "br", _A_NS + "t"
+# Dublin Core elements of docProps/core.xml, keyed by metadata field
+_CORE_PROPERTIES = {
+    "title": "{http://purl.org/dc/elements/1.1/}title",
+    "author": "{http://purl.org/dc/elements/1.1/}creator",
+    "created": "{http://purl.org/dc/terms/}created",
+    "modified": "{http://purl.org/dc/terms/}modified",
+}
+
+# Other heading style names, such as "heading 2" or "Heading 1 Char"
+_HEADING_RE = re.compile(r"heading\s*([1-9])?", re.IGNORECASE)
+
+# Converter method for each supported document type, looked up on the instance at call time
+_DISPATCH = {".pdf": "convert_pdf", ".docx": "convert_docx", ".pptx": "convert_pptx"}
+
+# PDF readers accept the header anywhere in the first KiB of the file
+_PDF_HEADER, _PDF_HEADER_WINDOW = b"%PDF-", 1024
+
+# Document types handled by DocumentConverter
+SUPPORTED_EXTENSIONS = frozenset(_DISPATCH)
+
 
 @dataclass
 class ConversionResult:
@@ -47,63 +119,236 @@ class ConversionResult:
     status: str
     error: Optional[str] = None
     metadata: Optional[Dict] = None
+    content_hash: Optional[str] = None
 
 
 class DocumentConverter:
     """Main converter class for all document types"""
 
     def __init__(
-        self, output_dir: Optional[Path] = None, parallel: bool = True, base_input_path: Optional[Path] = None, enable_ocr: bool = False
+        self,
+        output_dir: Optional[Path] = None,
+        parallel: bool = True,
+        base_input_path: Optional[Path] = None,
+        enable_ocr: bool = False,
+        pretty_json: bool = False,
+        native_text: bool = False,
+        ocr_target_height: int = DEFAULT_OCR_TARGET_HEIGHT,
+        use_cache: bool = True,
+        max_inflight: Optional[int] = None,
+        skip_mkdir: bool = False,
+        fast_pptx: bool = False,
+        async_io: bool = False,
+        jsonl_path: Optional[Path] = None,
     ):
         self.output_dir = output_dir
         self.parallel = parallel
-        # Force CPU to avoid MPS issues on macOS with marker-pdf
-        self.device = torch.device("cpu")
+        # Documents submitted to the worker pool at once; defaults to twice the worker count
+        self.max_inflight = max_inflight
+        self.pretty_json = pretty_json
+        # Read slide text straight from the PPTX XML parts instead of python-pptx's object model
+        self.fast_pptx = fast_pptx
+        # In serial runs, write each document's outputs in the background while the next one is converted
+        self.async_io = async_io
+        self._writer: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._pending_write: Optional[concurrent.futures.Future] = None
+        # Single JSON Lines file receiving every document's JSON record instead of per-document sidecars
+        self._jsonl_path = jsonl_path
+        self._jsonl_fd: Optional[int] = None
+        # Serializes appends from pool workers; set by _worker_init
+        self._jsonl_lock = None
+        # Use CUDA when present; MPS is never used because of issues with marker-pdf on macOS
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.pdf_converter = None
         self.base_input_path = base_input_path
-        self.ocr_manager = OCRManager(self.device, enable_ocr=enable_ocr)
+        # Absolute input directory, with a trailing separator, whose structure is mirrored under output_dir
+        self._base_prefix = (
+            os.path.join(os.path.abspath(base_input_path), "") if base_input_path and base_input_path.is_dir() else None
+        )
+        # Output path layout, chosen once: (markdown path, json path) for an input path
+        if not output_dir:
+            self._get_output_paths = self._outputs_inplace
+        elif self._base_prefix is None:
+            self._get_output_paths = self._outputs_flat
+        else:
+            self._get_output_paths = self._outputs_preserve
+        self.ocr_manager = OCRManager(
+            self.device, enable_ocr=enable_ocr, native_text=native_text, ocr_target_height=ocr_target_height
+        )
+        # Content-hash manifest of previous conversions, only kept alongside an output directory. A JSON Lines
+        # file is rewritten on every run, so it needs every document converted and bypasses the cache.
+        use_manifest = output_dir and use_cache and jsonl_path is None
+        self._manifest_path = output_dir / MANIFEST_FILENAME if use_manifest else None
+        self._cache_options = {
+            "enable_ocr": enable_ocr,
+            "pretty_json": pretty_json,
+            "native_text": native_text,
+            "ocr_target_height": ocr_target_height,
+            "fast_pptx": fast_pptx,
+        }
+        self._manifest = self._load_manifest()
+        # Output directories known to exist, so each is created once rather than twice per file
+        self._created_dirs: Set[Path] = set()
+        # Set for pool workers, whose output directories are created by the parent in convert_all
+        self.skip_mkdir = skip_mkdir
+        # Pickle-safe settings used to rebuild the converter inside worker processes
+        self._config = {
+            "output_dir": output_dir,
+            "base_input_path": base_input_path,
+            "enable_ocr": enable_ocr,
+            "pretty_json": pretty_json,
+            "native_text": native_text,
+            "ocr_target_height": ocr_target_height,
+            "use_cache": use_cache,
+            "fast_pptx": fast_pptx,
+            "jsonl_path": jsonl_path,
+        }
+
+    def _load_manifest(self) -> Optional[Dict[str, str]]:
+        """Load source -> content hash entries written by a previous run with the same options"""
+        if self._manifest_path is None:
+            return None
+        try:
+            data = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("options") != self._cache_options:
+            return {}
+        return dict(data.get("files", {}))
+
+    def _save_manifest(self, results: List[ConversionResult]):
+        """Record content hashes of successful conversions for the next run"""
+        if self._manifest is None:
+            return
+        for result in results:
+            if result.status == "success" and result.content_hash:
+                self._manifest[os.path.abspath(result.source_path)] = result.content_hash
+
+        try:
+            self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._manifest_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps({"options": self._cache_options, "files": self._manifest}), encoding="utf-8")
+            os.replace(tmp_path, self._manifest_path)
+        except OSError as e:
+            console.print(f"[yellow]Could not write conversion cache manifest: {e}[/yellow]")
+
+    @staticmethod
+    def _content_hash(path: Path) -> str:
+        """BLAKE2b digest of the file contents, read in chunks"""
+        digest = hashlib.blake2b(digest_size=16)
+        with path.open("rb") as f:
+            for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
 
     def _load_pdf_converter(self):
         """Lazy load PDF converter"""
         if self.pdf_converter is None:
             self.pdf_converter = PdfConverter(
-                artifact_dict=create_model_dict(),
+                artifact_dict=_get_models(),
             )
 
-    def _get_output_paths(self, input_path: Path) -> Tuple[Path, Path]:
-        """Generate output paths for markdown and json files in separate subdirectories"""
-        if self.output_dir:
-            # If we have a base input path (directory was passed), preserve structure
-            if self.base_input_path and self.base_input_path.is_dir():
-                try:
-                    # Get the relative path from the base input directory
-                    relative_path = input_path.relative_to(self.base_input_path)
-                    # Create separate md and json subdirectories
-                    md_base = self.output_dir / "md" / relative_path.parent / input_path.stem
-                    json_base = self.output_dir / "json" / relative_path.parent / input_path.stem
-                except ValueError:
-                    # If the file is not under base_input_path, just use the filename
-                    md_base = self.output_dir / "md" / input_path.stem
-                    json_base = self.output_dir / "json" / input_path.stem
-            else:
-                # Single file was passed, just use the filename
-                md_base = self.output_dir / "md" / input_path.stem
-                json_base = self.output_dir / "json" / input_path.stem
+    def _outputs_inplace(self, input_path: Path) -> Tuple[Path, Path]:
+        """Output paths next to the source, used when no output dir is specified"""
+        base = input_path.parent / input_path.stem
+        return base.with_suffix(".md"), self._jsonl_path or base.with_suffix(".json")
+
+    def _outputs_flat(self, input_path: Path) -> Tuple[Path, Path]:
+        """Output paths directly in the md and json subdirectories, used for single files"""
+        stem = input_path.stem
+        md_path = self.output_dir.joinpath("md", stem).with_suffix(".md")
+        json_path = self._jsonl_path or self.output_dir.joinpath("json", stem).with_suffix(".json")
+        return md_path, json_path
+
+    def _outputs_preserve(self, input_path: Path) -> Tuple[Path, Path]:
+        """Output paths mirroring the input directory's structure; files outside it are placed flat"""
+        # abspath is string-only (no resolve() per file), so symlinks are compared as spelled
+        input_str = os.path.abspath(input_path)
+        if not input_str.startswith(self._base_prefix):
+            return self._outputs_flat(input_path)
+        relative_dirs = input_str[len(self._base_prefix) :].split(os.sep)[:-1]
+
+        stem = input_path.stem
+        md_path = self.output_dir.joinpath("md", *relative_dirs, stem).with_suffix(".md")
+        json_path = self._jsonl_path or self.output_dir.joinpath("json", *relative_dirs, stem).with_suffix(".json")
+        return md_path, json_path
+
+    def _ensure_dirs(self, dirs: Iterable[Path]):
+        """Create output directories that have not been created by this converter yet"""
+        if self.skip_mkdir:
+            return
+        for directory in dirs:
+            if directory not in self._created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._created_dirs.add(directory)
+
+    def _dump_json(self, json_data: Dict, pretty: Optional[bool] = None) -> bytes:
+        """Serialize the JSON sidecar to UTF-8 bytes, with orjson when it is installed"""
+        if pretty is None:
+            pretty = self.pretty_json
+        if orjson is not None:
+            return orjson.dumps(json_data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        # Same output as orjson: non-ASCII text is kept as UTF-8 rather than escaped
+        if pretty:
+            return json.dumps(json_data, indent=2, ensure_ascii=False).encode("utf-8")
+        return json.dumps(json_data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    def _write_outputs(self, md_path: Path, json_path: Path, full_text: str, json_data: Dict):
+        """Encode markdown and JSON once and write each file with a single write"""
+        jsonl_record = None
+        if self._jsonl_path is not None:
+            # json_path is the shared JSON Lines file, which gets one compact record per document
+            jsonl_record = self._dump_json(json_data, pretty=False) + b"\n"
+            outputs = ((md_path, full_text.encode("utf-8")),)
         else:
-            # When no output dir specified, put files next to original
-            base = input_path.parent / input_path.stem
-            return base.with_suffix(".md"), base.with_suffix(".json")
-
-        return md_base.with_suffix(".md"), json_base.with_suffix(".json")
+            outputs = ((md_path, full_text.encode("utf-8")), (json_path, self._dump_json(json_data)))
+        if self._writer is not None:
+            # Encoding stays here; only the file I/O is handed to the writer thread
+            self._pending_write = self._writer.submit(self._write_document, outputs, jsonl_record)
+        else:
+            self._write_document(outputs, jsonl_record)
+
+    def _write_document(self, outputs: Iterable[Tuple[Path, bytes]], jsonl_record: Optional[bytes]):
+        """Write a document's output files, then its JSON Lines record, so no record outlives a failed write"""
+        _write_files(outputs)
+        if jsonl_record is not None:
+            self._append_jsonl(jsonl_record)
+
+    def _append_jsonl(self, record: bytes):
+        """Append one record to the JSON Lines file, opened once per process"""
+        if self._jsonl_fd is None:
+            self._jsonl_fd = os.open(self._jsonl_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        # Unbuffered writes under the lock keep records from different workers on separate lines
+        with self._jsonl_lock or contextlib.nullcontext():
+            view = memoryview(record)
+            while view:
+                view = view[os.write(self._jsonl_fd, view) :]
+
+    def _start_jsonl(self):
+        """Empty the JSON Lines file so it ends up with exactly this run's records"""
+        self._close_jsonl()
+        os.makedirs(os.path.dirname(os.path.abspath(self._jsonl_path)), exist_ok=True)
+        self._jsonl_fd = os.open(self._jsonl_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_TRUNC, 0o644)
+
+    def _close_jsonl(self):
+        """Close the JSON Lines file if this process opened it"""
+        if self._jsonl_fd is not None:
+            os.close(self._jsonl_fd)
+            self._jsonl_fd = None
 
     def convert_pdf(self, pdf_path: Path) -> ConversionResult:
         """Convert PDF to markdown using marker-pdf with OCR fallback for scanned PDFs"""
         try:
-            # Check if OCR is needed for this PDF
+            # Check if OCR (or the native text layer) should handle this PDF
             ocr_result = self.ocr_manager.process_if_needed(pdf_path)
 
-            if ocr_result:
-                # OCR was used
+            if ocr_result and ocr_result[1].get("engine") == "pymupdf":
+                # The embedded text layer was used: neither OCR nor marker ran, and no images were extracted
+                full_text, text_metadata = ocr_result
+                metadata = {"ocr_used": False, "engine": "pymupdf", "page_count": text_metadata.get("page_count", 0)}
+                images_count = 0
+            elif ocr_result:
+                # OCR handled the PDF, marker is skipped entirely
                 full_text, ocr_metadata = ocr_result
                 metadata = {"ocr_used": True, **ocr_metadata}
                 images_count = ocr_metadata.get("page_count", 0)
@@ -117,13 +362,9 @@ class DocumentConverter:
 
             # Get output paths
             md_path, json_path = self._get_output_paths(pdf_path)
-            md_path.parent.mkdir(parents=True, exist_ok=True)
-            json_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Save markdown
-            md_path.write_text(full_text, encoding="utf-8")
+            self._ensure_dirs((md_path.parent, json_path.parent))
 
-            # Save JSON with metadata
+            # Save markdown and JSON with metadata
             json_data = {
                 "source": str(pdf_path),
                 "type": "pdf",
@@ -131,7 +372,7 @@ class DocumentConverter:
                 "metadata": metadata,
                 "images": images_count,
             }
-            json_path.write_text(json.dumps(json_data, indent=2), encoding="utf-8")
+            self._write_outputs(md_path, json_path, full_text, json_data)
 
             return ConversionResult(
                 source_path=str(pdf_path),
@@ -147,44 +388,51 @@ class DocumentConverter:
             )
 
     def convert_docx(self, docx_path: Path) -> ConversionResult:
-        """Convert DOCX to markdown"""
+        """Convert DOCX to markdown by walking the document XML instead of python-docx's paragraph objects"""
         try:
             doc = Document(docx_path)
-
-            # Extract text with basic formatting
-            markdown_lines = []
-
-            for para in doc.paragraphs:
-                if para.style.name.startswith("Heading"):
-                    level = int(para.style.name[-1]) if para.style.name[-1].isdigit() else 1
-                    markdown_lines.append(f"{'#' * level} {para.text}")
-                elif para.text.strip():
-                    # Handle basic formatting
-                    text = para.text
-                    for run in para.runs:
-                        if run.bold:
-                            text = text.replace(run.text, f"**{run.text}**", 1)
-                        elif run.italic:
-                            text = text.replace(run.text, f"*{run.text}*", 1)
-                    markdown_lines.append(text)
+            style_names, default_style = _docx_paragraph_styles(doc)
+
+            # One pass over the paragraphs writes the markdown and collects the JSON blocks together,
+            # each markdown block followed by a blank line
+            buf = io.StringIO()
+            write = buf.write
+            blocks = []
+
+            # Top-level body paragraphs, the same set python-docx exposes as doc.paragraphs
+            for p in doc.element.body.iterchildren(_W_P):
+                p_pr = p.find(_W_PPR)
+                p_style = p_pr.find(_W_PSTYLE) if p_pr is not None else None
+                # Paragraphs without a style, or with an unknown one, use the default paragraph style
+                style_name = default_style
+                if p_style is not None:
+                    style_name = style_names.get(p_style.get(_W_VAL), default_style)
+                prefix = _heading_prefix(style_name) if style_name else None
+                text, formatted = _docx_paragraph_text(p)
+
+                if prefix is not None:
+                    write(f"{prefix}{text}\n\n")
+                    blocks.append({"type": "heading", "level": len(prefix) - 1, "text": text})
+                elif text.strip():
+                    write(formatted)
+                    write("\n\n")
+                    blocks.append({"type": "paragraph", "text": text})
                 else:
-                    markdown_lines.append("")
+                    write("\n\n")
 
-            full_text = "\n\n".join(markdown_lines)
+            # Drop the separator after the last block
+            full_text = buf.getvalue()[:-2]
 
             # Get output paths
             md_path, json_path = self._get_output_paths(docx_path)
-            md_path.parent.mkdir(parents=True, exist_ok=True)
-            json_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Save markdown
-            md_path.write_text(full_text, encoding="utf-8")
+            self._ensure_dirs((md_path.parent, json_path.parent))
 
-            # Save JSON
+            # Save markdown and JSON
             json_data = {
                 "source": str(docx_path),
                 "type": "docx",
                 "content": full_text,
+                "blocks": blocks,
                 "metadata": {
                     "author": doc.core_properties.author or "",
                     "created": doc.core_properties.created.isoformat() if doc.core_properties.created else "",
@@ -192,7 +440,7 @@ class DocumentConverter:
                     "title": doc.core_properties.title or "",
                 },
             }
-            json_path.write_text(json.dumps(json_data, indent=2), encoding="utf-8")
+            self._write_outputs(md_path, json_path, full_text, json_data)
 
             return ConversionResult(
                 source_path=str(docx_path),
@@ -210,53 +458,36 @@ class DocumentConverter:
     def convert_pptx(self, pptx_path: Path) -> ConversionResult:
         """Convert PPTX to markdown"""
         try:
-            prs = Presentation(pptx_path)
-
-            markdown_lines = []
-
-            for i, slide in enumerate(prs.slides, 1):
-                markdown_lines.append(f"# Slide {i}")
-
-                # Extract text from all shapes
-                for shape in slide.shapes:
-                    if hasattr(shape, "text") and shape.text.strip():
-                        # Check if it's a title
-                        if shape == slide.shapes.title:
-                            markdown_lines.append(f"## {shape.text.strip()}")
-                        else:
-                            markdown_lines.append(shape.text.strip())
-
-                # Add notes if present
-                if slide.has_notes_slide and slide.notes_slide.notes_text_frame.text.strip():
-                    markdown_lines.append("\n**Notes:**")
-                    markdown_lines.append(slide.notes_slide.notes_text_frame.text.strip())
-
-                markdown_lines.append("")  # Add spacing between slides
-
-            full_text = "\n\n".join(markdown_lines)
+            if self.fast_pptx:
+                with zipfile.ZipFile(pptx_path) as package:
+                    slide_parts = _pptx_slide_parts(package)
+                    full_text = _pptx_markdown(_iter_pptx_xml_slides(package, slide_parts))
+                    properties = _pptx_core_properties(package)
+                slide_count = len(slide_parts)
+            else:
+                prs = Presentation(pptx_path)
+                full_text = _pptx_markdown(_iter_pptx_slides(prs))
+                slide_count = len(prs.slides)
+                core = prs.core_properties
+                properties = {
+                    "title": core.title or "",
+                    "author": core.author or "",
+                    "created": core.created.isoformat() if core.created else "",
+                    "modified": core.modified.isoformat() if core.modified else "",
+                }
 
             # Get output paths
             md_path, json_path = self._get_output_paths(pptx_path)
-            md_path.parent.mkdir(parents=True, exist_ok=True)
-            json_path.parent.mkdir(parents=True, exist_ok=True)
+            self._ensure_dirs((md_path.parent, json_path.parent))
 
-            # Save markdown
-            md_path.write_text(full_text, encoding="utf-8")
-
-            # Save JSON
+            # Save markdown and JSON
             json_data = {
                 "source": str(pptx_path),
                 "type": "pptx",
                 "content": full_text,
-                "metadata": {
-                    "slide_count": len(prs.slides),
-                    "title": prs.core_properties.title or "",
-                    "author": prs.core_properties.author or "",
-                    "created": prs.core_properties.created.isoformat() if prs.core_properties.created else "",
-                    "modified": prs.core_properties.modified.isoformat() if prs.core_properties.modified else "",
-                },
+                "metadata": {"slide_count": slide_count, **properties},
             }
-            json_path.write_text(json.dumps(json_data, indent=2), encoding="utf-8")
+            self._write_outputs(md_path, json_path, full_text, json_data)
 
             return ConversionResult(
                 source_path=str(pptx_path),
@@ -271,36 +502,49 @@ class DocumentConverter:
                 source_path=str(pptx_path), markdown_path="", json_path="", status="error", error=str(e)
             )
 
-    def find_documents(self, path: Path, skip_pdf: bool = False) -> List[Path]:
-        """Recursively find all supported documents"""
-        supported_extensions = {".pdf", ".docx", ".pptx"}
-        
+    def iter_documents(self, path: Path, skip_pdf: bool = False) -> Iterator[Path]:
+        """Recursively yield supported documents in sorted path order as they are found"""
+        for doc, _ in self._iter_dispatch(path, skip_pdf=skip_pdf):
+            yield doc
+
+    def _iter_dispatch(self, path: Path, skip_pdf: bool = False) -> Iterator[Tuple[Path, str]]:
+        """Yield (document, converter method name) pairs, resolving each file's type once during the walk"""
+        dispatch = _DISPATCH
         if skip_pdf:
-            supported_extensions.discard(".pdf")
+            dispatch = {suffix: name for suffix, name in _DISPATCH.items() if suffix != ".pdf"}
             console.print("[yellow]Note: PDF files are skipped due to compatibility issues[/yellow]")
-        
-        documents = []
 
         if path.is_file():
-            if path.suffix.lower() in supported_extensions:
-                documents.append(path)
-        else:
-            for ext in supported_extensions:
-                documents.extend(path.rglob(f"*{ext}"))
+            method_name = dispatch.get(path.suffix.lower())
+            if method_name is not None:
+                yield path, method_name
+            return
+
+        # Iterative scandir walk: directory entries carry their type, so names are filtered
+        # by extension without a stat call and Path objects are only built for matches.
+        # Visiting entries sorted by name, depth first, yields paths in sorted order.
+        splitext = os.path.splitext
+        stack = [iter(_sorted_entries(os.fspath(path)))]
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+            elif entry.is_dir(follow_symlinks=False):
+                stack.append(iter(_sorted_entries(entry.path)))
+            else:
+                method_name = dispatch.get(splitext(entry.name)[1].lower())
+                if method_name is not None:
+                    yield Path(entry.path), method_name
 
-        return sorted(documents)
+    def find_documents(self, path: Path, skip_pdf: bool = False) -> List[Path]:
+        """Recursively find all supported documents"""
+        return list(self.iter_documents(path, skip_pdf=skip_pdf))
 
     def convert_document(self, doc_path: Path) -> ConversionResult:
-        """Convert a single document based on its type"""
+        """Convert a single document based on its type, skipping unchanged documents"""
         suffix = doc_path.suffix.lower()
-
-        if suffix == ".pdf":
-            return self.convert_pdf(doc_path)
-        elif suffix == ".docx":
-            return self.convert_docx(doc_path)
-        elif suffix == ".pptx":
-            return self.convert_pptx(doc_path)
-        else:
+        method_name = _DISPATCH.get(suffix)
+        if method_name is None:
             return ConversionResult(
                 source_path=str(doc_path),
                 markdown_path="",
@@ -308,54 +552,555 @@ class DocumentConverter:
                 status="error",
                 error=f"Unsupported file type: {suffix}",
             )
+        return self._convert(doc_path, method_name)
 
-    def convert_all(self, path: Path, skip_pdf: bool = False) -> List[ConversionResult]:
-        """Convert all documents found in path"""
-        documents = self.find_documents(path, skip_pdf=skip_pdf)
+    def _convert(self, doc_path: Path, method_name: str) -> ConversionResult:
+        """Convert a document with the named converter method, unless it is unchanged since the last run"""
+        # Reject empty and non-PDF files before any parser or model is loaded for them
+        problem = _check_source(doc_path, method_name)
+        if problem:
+            return ConversionResult(
+                source_path=str(doc_path), markdown_path="", json_path="", status="error", error=problem
+            )
 
-        if not documents:
+        content_hash = None
+        if self._manifest is not None:
+            try:
+                content_hash = self._content_hash(doc_path)
+            except OSError:
+                content_hash = None
+            if content_hash and self._manifest.get(os.path.abspath(doc_path)) == content_hash:
+                md_path, json_path = self._get_output_paths(doc_path)
+                if md_path.exists() and json_path.exists():
+                    return ConversionResult(
+                        source_path=str(doc_path),
+                        markdown_path=str(md_path),
+                        json_path=str(json_path),
+                        status="cached",
+                        content_hash=content_hash,
+                    )
+
+        result = getattr(self, method_name)(doc_path)
+        if result.status == "success":
+            result.content_hash = content_hash
+        return result
+
+    @staticmethod
+    def _report(result: ConversionResult):
+        """Print the outcome of one conversion"""
+        if result.status == "success":
+            console.print(f"[green]✓[/green] {result.source_path}")
+        elif result.status == "cached":
+            console.print(f"[blue]↺[/blue] {result.source_path} (unchanged, cached)")
+        else:
+            console.print(f"[red]✗[/red] {result.source_path}: {result.error}")
+
+    def convert_all(
+        self, path: Path, skip_pdf: bool = False, parallel: Optional[bool] = None
+    ) -> List[ConversionResult]:
+        """Convert all documents found in path, in a process pool unless parallel (default: self.parallel) is False"""
+        if parallel is None:
+            parallel = self.parallel
+        if self._jsonl_path is not None:
+            self._start_jsonl()
+        try:
+            return self._convert_found(path, skip_pdf, parallel)
+        finally:
+            # Also when nothing is found or conversion fails, so the JSON Lines file is never left open
+            self.ocr_manager.close()
+            self._close_jsonl()
+
+    def _convert_found(self, path: Path, skip_pdf: bool, parallel: bool) -> List[ConversionResult]:
+        """Discover the documents under path and convert them, reporting progress"""
+        # Discovery is streamed into conversion. The first window of documents is read up front
+        # to decide whether a worker pool is worth starting.
+        max_workers = max(1, (os.cpu_count() or 2) - 1)
+        max_inflight = self.max_inflight or max_workers * 2
+        documents = self._iter_dispatch(path, skip_pdf=skip_pdf)
+        head = list(itertools.islice(documents, max_inflight if parallel else 1))
+
+        if not head:
             console.print("[yellow]No supported documents found!")
             return []
 
-        console.print(f"[green]Found {len(documents)} documents to convert")
-
         results = []
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Converting documents...", total=len(documents))
-
-            if self.parallel and len(documents) > 1:
-                with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-                    future_to_doc = {executor.submit(self.convert_document, doc): doc for doc in documents}
-
-                    for future in concurrent.futures.as_completed(future_to_doc):
-                        result = future.result()
-                        results.append(result)
-                        progress.update(task, advance=1)
-
-                        if result.status == "success":
-                            console.print(f"[green]✓[/green] {result.source_path}")
-                        else:
-                            console.print(f"[red]✗[/red] {result.source_path}: {result.error}")
+        with contextlib.ExitStack() as stack:
+            executor = None
+            if parallel and len(head) > 1:
+                # Fork pools get the marker models up front when the first documents include PDFs
+                load_models = any(method_name == "convert_pdf" for _, method_name in head)
+                # Started before the progress display, so workers are never forked while its refresh thread runs
+                executor = stack.enter_context(self._worker_pool(min(max_workers, len(head)), load_models))
+            progress = stack.enter_context(
+                Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                    console=console,
+                )
+            )
+            task = progress.add_task("Converting documents...", total=len(head))
+
+            def record(result: ConversionResult):
+                results.append(result)
+                progress.update(task, advance=1)
+                self._report(result)
+
+            discovered = self._track_discovery(itertools.chain(head, documents), progress, task)
+            if executor is not None:
+                self._convert_in_pool(executor, discovered, max_inflight, record)
+            elif self.async_io:
+                self._convert_with_write_behind(discovered, record)
             else:
-                for doc in documents:
-                    result = self.convert_document(doc)
-                    results.append(result)
-                    progress.update(task, advance=1)
-
-                    if result.status == "success":
-                        console.print(f"[green]✓[/green] {result.source_path}")
-                    else:
-                        console.print(f"[red]✗[/red] {result.source_path}: {result.error}")
+                for doc, method_name in discovered:
+                    record(self._convert(doc, method_name))
 
+        # Discovery is only complete once conversion is, so report the count afterwards
+        console.print(f"[green]Processed {len(results)} documents")
+        self._save_manifest(results)
         return results
 
+    def _track_discovery(
+        self, documents: Iterable[Tuple[Path, str]], progress: Progress, task
+    ) -> Iterator[Tuple[Path, str]]:
+        """Create output directories and grow the progress total as documents are found"""
+        count = 0
+        for item in documents:
+            count += 1
+            self._ensure_dirs(p.parent for p in self._get_output_paths(item[0]))
+            progress.update(task, total=count)
+            yield item
+
+    def _convert_with_write_behind(
+        self, documents: Iterable[Tuple[Path, str]], record: Callable[[ConversionResult], None]
+    ):
+        """Convert documents serially, writing each one's outputs while the next document is converted"""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as writer:
+            self._writer = writer
+            try:
+                previous = None
+                for doc, method_name in documents:
+                    result = self._convert(doc, method_name)
+                    current = (result, self._pending_write)
+                    self._pending_write = None
+                    # Report the previous document only once its writes have landed
+                    if previous is not None:
+                        record(self._finish_write(*previous))
+                    previous = current
+                if previous is not None:
+                    record(self._finish_write(*previous))
+            finally:
+                self._writer = None
+                self._pending_write = None
+
+    @staticmethod
+    def _finish_write(result: ConversionResult, write: Optional[concurrent.futures.Future]) -> ConversionResult:
+        """Wait for a document's background writes, turning a failed write into an error result"""
+        if write is None:
+            return result
+        try:
+            write.result()
+        except OSError as e:
+            return ConversionResult(
+                source_path=result.source_path, markdown_path="", json_path="", status="error", error=str(e)
+            )
+        return result
+
+    @contextlib.contextmanager
+    def _worker_pool(self, max_workers: int, load_models: bool) -> Iterator[concurrent.futures.ProcessPoolExecutor]:
+        """Start the conversion process pool; fork pools have all their workers running when it is returned"""
+        # Conversion is CPU-bound Python, so use processes to sidestep the GIL
+        mp_context = _pool_context(self.device)
+        jsonl_lock = mp_context.Lock() if self._jsonl_path is not None else None
+        forked = mp_context.get_start_method() == "fork"
+        if forked:
+            if load_models:
+                # Load the models once here: forked workers inherit them copy-on-write instead of
+                # each loading a private copy. Spawned workers load them on their first PDF.
+                _get_models()
+            # Keep the cyclic GC from writing to inherited objects, which would copy their pages
+            gc.freeze()
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=mp_context,
+                initializer=_worker_init,
+                # Output directories are created here, as documents are discovered
+                initargs=({**self._config, "skip_mkdir": True}, jsonl_lock, max_workers),
+            ) as executor:
+                if forked:
+                    # The first submit forks every worker, so do it while no other thread of this run exists
+                    executor.submit(os.getpid).result()
+                if self.device.type == "cuda":
+                    # PDFs are converted in this process, alongside the pool's appends
+                    self._jsonl_lock = jsonl_lock
+                yield executor
+        finally:
+            self._jsonl_lock = None
+            if forked:
+                gc.unfreeze()
+
+    def _convert_in_pool(
+        self,
+        executor: concurrent.futures.Executor,
+        documents: Iterator[Tuple[Path, str]],
+        max_inflight: int,
+        record: Callable[[ConversionResult], None],
+    ):
+        """Convert documents in the worker pool, keeping at most max_inflight of them submitted"""
+        if self.device.type == "cuda":
+            # Every worker would load its own marker and Surya models onto the GPU. Convert PDFs
+            # here with a single copy of the models and leave the other documents to the pool.
+            documents = self._convert_pdfs_inline(documents, record)
+        self._drain_pool(executor, documents, max_inflight, record)
+
+    def _convert_pdfs_inline(
+        self, documents: Iterable[Tuple[Path, str]], record: Callable[[ConversionResult], None]
+    ) -> Iterator[Tuple[Path, str]]:
+        """Convert PDFs in this process as they are discovered, passing the other documents on"""
+        for doc, method_name in documents:
+            if method_name == "convert_pdf":
+                record(self._convert(doc, method_name))
+            else:
+                yield doc, method_name
+
+    @staticmethod
+    def _drain_pool(
+        executor: concurrent.futures.Executor,
+        documents: Iterator[Tuple[Path, str]],
+        max_inflight: int,
+        record: Callable[[ConversionResult], None],
+    ):
+        """Submit the next document as each finishes, instead of holding a future for every document at once"""
+        inflight = {
+            executor.submit(_convert_one, str(doc), method_name)
+            for doc, method_name in itertools.islice(documents, max_inflight)
+        }
+
+        while inflight:
+            done, inflight = concurrent.futures.wait(inflight, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                record(future.result())
+
+                next_item = next(documents, None)
+                if next_item is not None:
+                    inflight.add(executor.submit(_convert_one, str(next_item[0]), next_item[1]))
+
+
+def _sorted_entries(directory: str) -> List[os.DirEntry]:
+    """Directory entries sorted by name; unreadable directories are skipped, as os.walk does"""
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(entries, key=lambda entry: entry.name)
+    except OSError:
+        return []
+
+
+def _docx_paragraph_styles(doc) -> Tuple[Dict[str, str], Optional[str]]:
+    """Map paragraph style ids to their UI names, as python-docx reports them, plus the default style name"""
+    names = {}
+    default_name = None
+    for style in doc.styles.element.iterchildren(_W_STYLE):
+        if style.get(_W_TYPE) != "paragraph":
+            continue
+        name = style.find(_W_NAME)
+        ui_name = BabelFish.internal2ui(name.get(_W_VAL)) if name is not None else None
+        names[style.get(_W_STYLE_ID)] = ui_name
+        if style.get(_W_DEFAULT) in ("1", "true", "on"):
+            default_name = ui_name
+    return names, default_name
+
+
+def _docx_paragraph_text(p) -> Tuple[str, str]:
+    """Plain and bold/italic-marked text of a w:p element, including runs inside hyperlinks"""
+    plain = []
+    formatted = []
+    for child in p.iterchildren(_W_R, _W_HYPERLINK):
+        runs = child.iterchildren(_W_R) if child.tag == _W_HYPERLINK else (child,)
+        for r in runs:
+            text = "".join(_RUN_CONTENT[e.tag](e) for e in r.iterchildren(*_RUN_CONTENT))
+            plain.append(text)
+            if text.strip():
+                r_pr = r.find(_W_RPR)
+                if r_pr is not None:
+                    if _is_on(r_pr.find(_W_B)):
+                        text = f"**{text}**"
+                    elif _is_on(r_pr.find(_W_I)):
+                        text = f"*{text}*"
+            formatted.append(text)
+    return "".join(plain), "".join(formatted)
+
+
+def _is_on(element) -> bool:
+    """Value of an on/off property such as w:b, which is on unless its w:val says otherwise"""
+    return element is not None and element.get(_W_VAL) not in ("0", "false", "off")
+
+
+def _check_source(doc_path: Path, method_name: str) -> Optional[str]:
+    """Reason a source cannot be converted, found without opening it in a parser"""
+    try:
+        if method_name != "convert_pdf":
+            return "Empty file" if os.stat(doc_path).st_size == 0 else None
+        with open(doc_path, "rb") as f:
+            head = f.read(_PDF_HEADER_WINDOW)
+    except OSError as e:
+        return str(e)
+    if not head:
+        return "Empty file"
+    if _PDF_HEADER not in head:
+        return "Not a PDF file (missing %PDF- header)"
+    return None
+
+
+def _write_files(outputs: Iterable[Tuple[Path, bytes]]):
+    """Write each encoded output file"""
+    for path, data in outputs:
+        path.write_bytes(data)
+
+
+def _pptx_markdown(slides: Iterable[Tuple[List[Tuple[bool, str]], str]]) -> str:
+    """Render (shape texts flagged as title, notes) per slide as markdown"""
+    buf = io.StringIO()
+    write = buf.write
+
+    for i, (shapes, notes_text) in enumerate(slides, 1):
+        write(f"# Slide {i}\n\n")
+
+        for is_title, shape_text in shapes:
+            write(f"## {shape_text}\n\n" if is_title else f"{shape_text}\n\n")
+
+        if notes_text:
+            write(f"\n**Notes:**\n\n{notes_text}\n\n")
+
+        write("\n\n")  # Add spacing between slides
+
+    # Drop the separator after the last block
+    return buf.getvalue()[:-2]
+
+
+def _iter_pptx_slides(prs) -> Iterator[Tuple[List[Tuple[bool, str]], str]]:
+    """Yield the non-empty shape texts and notes of each slide through python-pptx"""
+    for slide in prs.slides:
+        # Look the title placeholder up once per slide, not once per shape
+        shapes = slide.shapes
+        title_shape = shapes.title
+
+        texts = []
+        for shape in shapes:
+            # has_text_frame is a plain flag on every shape, unlike probing for a text property
+            if not shape.has_text_frame:
+                continue
+            shape_text = shape.text.strip()
+            if shape_text:
+                # Shape proxies compare by their XML element
+                texts.append((title_shape is not None and shape == title_shape, shape_text))
+
+        notes_text = slide.notes_slide.notes_text_frame.text.strip() if slide.has_notes_slide else ""
+        yield texts, notes_text
+
+
+def _iter_pptx_xml_slides(
+    package: zipfile.ZipFile, slide_parts: List[str]
+) -> Iterator[Tuple[List[Tuple[bool, str]], str]]:
+    """Yield the same per-slide text as _iter_pptx_slides, parsing one slide part at a time"""
+    for part in slide_parts:
+        tree = ET.parse(package.open(part))
+        title_found = False
+        texts = []
+        for sp, ph in _iter_sp_tree(tree):
+            # Like SlideShapes.title, only the first idx-0 placeholder is the title
+            is_title = not title_found and ph is not None and ph.get("idx", "0") == "0"
+            title_found = title_found or is_title
+            shape_text = _drawingml_text(sp).strip()
+            if shape_text:
+                texts.append((is_title, shape_text))
+
+        notes_text = ""
+        notes_part = _rel_target(_zip_rels(package, part), _RT_NS + "notesSlide")
+        if notes_part:
+            for sp, ph in _iter_sp_tree(ET.parse(package.open(notes_part))):
+                if ph is not None and ph.get("type") == "body":
+                    notes_text = _drawingml_text(sp).strip()
+                    break
+        yield texts, notes_text
+
+
+def _iter_sp_tree(tree: ET.ElementTree) -> Iterator[Tuple[ET.Element, Optional[ET.Element]]]:
+    """Yield top-level text shapes of a slide with their placeholder element, if any"""
+    sp_tree = tree.find(f"{_P_NS}cSld/{_P_NS}spTree")
+    if sp_tree is None:
+        return
+    # Group, picture and table shapes have no text frame of their own, as in python-pptx
+    for sp in sp_tree.iterfind(_P_SP):
+        if sp.find(_P_TXBODY) is not None:
+            yield sp, sp.find(f"{_P_NS}nvSpPr/{_P_NS}nvPr/{_P_PH}")
+
+
+def _drawingml_text(sp: ET.Element) -> str:
+    """Shape text as python-pptx's TextFrame.text renders it"""
+    return "\n".join(
+        "".join(
+            "\v" if child.tag == _A_BR else child.findtext(_A_T, "")
+            for child in p
+            if child.tag in (_A_R, _A_FLD, _A_BR)
+        )
+        for p in sp.find(_P_TXBODY).iterfind(_A_P)
+    )
+
+
+def _zip_rels(package: zipfile.ZipFile, part: str) -> Dict[str, Tuple[str, str]]:
+    """Map relationship IDs of a package part ("" for the package itself) to (type, target part name)"""
+    directory, name = posixpath.split(part)
+    rels_name = posixpath.join(directory, "_rels", name + ".rels")
+    if rels_name not in package.NameToInfo:
+        return {}
+    targets = {}
+    for rel in ET.parse(package.open(rels_name)).getroot().iterfind(_PKG_REL_NS + "Relationship"):
+        if rel.get("TargetMode") != "External":
+            target = posixpath.normpath(posixpath.join(directory, rel.get("Target"))).lstrip("/")
+            targets[rel.get("Id")] = (rel.get("Type"), target)
+    return targets
+
+
+def _rel_target(rels: Dict[str, Tuple[str, str]], rel_type: str) -> Optional[str]:
+    """Target part name of the first relationship of the given type"""
+    return next((target for kind, target in rels.values() if kind == rel_type), None)
+
+
+def _pptx_slide_parts(package: zipfile.ZipFile) -> List[str]:
+    """Slide part names in presentation order"""
+    presentation = _rel_target(_zip_rels(package, ""), _RT_NS + "officeDocument")
+    rels = _zip_rels(package, presentation)
+    sld_ids = ET.parse(package.open(presentation)).getroot().iterfind(f"{_P_NS}sldIdLst/{_P_NS}sldId")
+    return [rels[sld_id.get(_R_NS + "id")][1] for sld_id in sld_ids]
+
+
+def _pptx_core_properties(package: zipfile.ZipFile) -> Dict[str, str]:
+    """Title, author and dates from docProps/core.xml, formatted as in the python-pptx path"""
+    core_part = _rel_target(
+        _zip_rels(package, ""), "http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties"
+    )
+    root = ET.parse(package.open(core_part)).getroot() if core_part else ET.Element("coreProperties")
+    properties = {key: (root.findtext(tag) or "").strip() for key, tag in _CORE_PROPERTIES.items()}
+    for key in ("created", "modified"):
+        properties[key] = _w3cdtf_isoformat(properties[key])
+    return properties
+
+
+def _w3cdtf_isoformat(value: str) -> str:
+    """Normalize a W3CDTF timestamp to a naive UTC isoformat string, as python-pptx reports it"""
+    if not value:
+        return ""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return value
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.isoformat()
+
+
+@functools.lru_cache(maxsize=None)
+def _heading_prefix(style_name: str) -> Optional[str]:
+    """Markdown prefix for a paragraph style, or None if it is not a heading"""
+    prefix = _HEADING_PREFIXES.get(style_name)
+    if prefix is None:
+        match = _HEADING_RE.match(style_name)
+        if match:
+            prefix = "#" * int(match.group(1) or 1) + " "
+    return prefix
+
+
+@functools.lru_cache(maxsize=1)
+def _get_models() -> Dict:
+    """Load the marker model dict once per process and share it across PDF conversions"""
+    return create_model_dict()
+
+
+# Converter owned by the current worker process, set up by _worker_init
+_WORKER_CONVERTER: Optional[DocumentConverter] = None
+
+
+def _pool_context(device: Optional[torch.device] = None) -> multiprocessing.context.BaseContext:
+    """Fork on Linux so parent memory is shared copy-on-write, spawn elsewhere or when using CUDA"""
+    # CUDA cannot be used in a process forked after the parent touched the driver
+    if sys.platform.startswith("linux") and (device is None or device.type != "cuda"):
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("spawn")
+
+
+def _worker_init(config: Dict, jsonl_lock=None, processes: int = 1):
+    """Build the per-process converter once"""
+    global _WORKER_CONVERTER
+    # Torch thread pools are sized from this so the pool's processes share the cores
+    os.environ["DOCS2MD_CPU_PROCESSES"] = str(processes)
+    _WORKER_CONVERTER = DocumentConverter(parallel=False, **config)
+    _WORKER_CONVERTER._jsonl_lock = jsonl_lock
+    # Pool workers leave through multiprocessing's exit hook rather than atexit
+    multiprocessing.util.Finalize(None, _WORKER_CONVERTER.ocr_manager.close, exitpriority=0)
+
+
+def _convert_one(path: str, method_name: Optional[str] = None) -> ConversionResult:
+    """Convert a single document inside a worker process, with the converter method resolved during discovery"""
+    if method_name is None:
+        return _WORKER_CONVERTER.convert_document(Path(path))
+    return _WORKER_CONVERTER._convert(Path(path), method_name)
+
+
+def _print_summary(results: List[ConversionResult]):
+    """Print a per-document table and totals for the conversion results"""
+    # Create summary table
+    table = Table(title="Conversion Summary")
+    table.add_column("File", style="cyan")
+    table.add_column("Status", style="green")
+    table.add_column("Method", style="magenta")
+    table.add_column("Output", style="yellow")
+
+    success_count = 0
+    ocr_count = 0
+    cached_count = 0
+    for result in results:
+        if result.status == "success":
+            status, status_style = "✓ Success", "green"
+        elif result.status == "cached":
+            status, status_style = "↺ Cached", "blue"
+            cached_count += 1
+        else:
+            status, status_style = f"✗ Error: {result.error}", "red"
+
+        # Determine conversion method
+        method = "Standard"
+        if result.status == "success" and result.metadata:
+            if result.metadata.get("ocr_used", False):
+                method = f"OCR ({result.metadata.get('ocr_engine', 'unknown')})"
+                ocr_count += 1
+            elif result.metadata.get("engine") == "pymupdf":
+                method = "Native text"
+
+        if result.status in ("success", "cached"):
+            success_count += 1
+            output = f"{result.markdown_path}"
+        else:
+            output = "N/A"
+
+        table.add_row(
+            os.path.basename(result.source_path), f"[{status_style}]{status}[/{status_style}]", method, output
+        )
+
+    console.print(table)
+
+    # Enhanced summary with OCR info
+    failed_count = len(results) - success_count
+    summary_parts = [f"Total: {len(results)}", f"Success: {success_count}", f"Failed: {failed_count}"]
+    if ocr_count > 0:
+        summary_parts.append(f"OCR Used: {ocr_count}")
+    if cached_count > 0:
+        summary_parts.append(f"Cached: {cached_count}")
+
+    console.print(f"\n[bold]{' | '.join(summary_parts)}[/bold]")
+
 
 @click.command()
 @click.argument("path", type=click.Path(exists=True, path_type=Path))
@@ -364,7 +1109,50 @@ class DocumentConverter:
 @click.option("--summary", "-s", is_flag=True, help="Show conversion summary table")
 @click.option("--enable-ocr", is_flag=True, help="Enable OCR for scanned PDFs (experimental)")
 @click.option("--skip-pdf", is_flag=True, help="Skip PDF files (recommended due to compatibility issues)")
-def main(path: Path, output_dir: Optional[Path], no_parallel: bool, summary: bool, enable_ocr: bool, skip_pdf: bool):
+@click.option("--pretty-json", is_flag=True, help="Indent JSON output (default: compact)")
+@click.option("--native-text", is_flag=True, help="Use the embedded text layer of born-digital PDFs instead of marker")
+@click.option(
+    "--ocr-target-height",
+    type=click.IntRange(min=1),
+    default=DEFAULT_OCR_TARGET_HEIGHT,
+    show_default=True,
+    help="Approximate page height in pixels when rasterizing PDFs for OCR",
+)
+@click.option("--no-cache", is_flag=True, help="Reconvert documents even if they are unchanged since the last run")
+@click.option(
+    "--max-inflight",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum documents queued to parallel workers at once (default: twice the worker count)",
+)
+@click.option(
+    "--fast-pptx", is_flag=True, help="Read PPTX slide text directly from the XML parts instead of python-pptx"
+)
+@click.option(
+    "--jsonl",
+    "jsonl_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write every document's JSON record to this JSON Lines file instead of writing .json sidecars",
+)
+@click.option(
+    "--async-io", is_flag=True, help="With --no-parallel, write outputs in the background while the next file converts"
+)
+def main(
+    path: Path,
+    output_dir: Optional[Path],
+    no_parallel: bool,
+    summary: bool,
+    enable_ocr: bool,
+    skip_pdf: bool,
+    pretty_json: bool,
+    native_text: bool,
+    ocr_target_height: int,
+    no_cache: bool,
+    max_inflight: Optional[int],
+    fast_pptx: bool,
+    async_io: bool,
+    jsonl_path: Optional[Path],
+):
     """
     Convert PDF, DOCX, and PPTX files to Markdown and JSON.
 
@@ -376,51 +1164,24 @@ def main(path: Path, output_dir: Optional[Path], no_parallel: bool, summary: boo
 
     
     converter = DocumentConverter(
-        output_dir=output_dir, parallel=not no_parallel, base_input_path=path if path.is_dir() else None, enable_ocr=enable_ocr
+        output_dir=output_dir,
+        parallel=not no_parallel,
+        base_input_path=path if path.is_dir() else None,
+        enable_ocr=enable_ocr,
+        pretty_json=pretty_json,
+        native_text=native_text,
+        ocr_target_height=ocr_target_height,
+        use_cache=not no_cache,
+        max_inflight=max_inflight,
+        fast_pptx=fast_pptx,
+        async_io=async_io,
+        jsonl_path=jsonl_path,
     )
 
     results = converter.convert_all(path, skip_pdf=skip_pdf)
 
     if summary and results:
-        # Create summary table
-        table = Table(title="Conversion Summary")
-        table.add_column("File", style="cyan")
-        table.add_column("Status", style="green")
-        table.add_column("Method", style="magenta")
-        table.add_column("Output", style="yellow")
-
-        success_count = 0
-        ocr_count = 0
-        for result in results:
-            status = "✓ Success" if result.status == "success" else f"✗ Error: {result.error}"
-            status_style = "green" if result.status == "success" else "red"
-
-            # Determine conversion method
-            method = "Standard"
-            if result.status == "success" and result.metadata:
-                if result.metadata.get("ocr_used", False):
-                    method = f"OCR ({result.metadata.get('ocr_engine', 'unknown')})"
-                    ocr_count += 1
-
-            if result.status == "success":
-                success_count += 1
-                output = f"{result.markdown_path}"
-            else:
-                output = "N/A"
-
-            table.add_row(
-                os.path.basename(result.source_path), f"[{status_style}]{status}[/{status_style}]", method, output
-            )
-
-        console.print(table)
-
-        # Enhanced summary with OCR info
-        failed_count = len(results) - success_count
-        summary_parts = [f"Total: {len(results)}", f"Success: {success_count}", f"Failed: {failed_count}"]
-        if ocr_count > 0:
-            summary_parts.append(f"OCR Used: {ocr_count}")
-
-        console.print(f"\n[bold]{' | '.join(summary_parts)}[/bold]")
+        _print_summary(results)
 
 
 if __name__ == "__main__":
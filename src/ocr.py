@@ -1,21 +1,117 @@
 """OCR module for handling scanned PDFs using Surya"""
 
+import concurrent.futures
 import logging
+import multiprocessing
+import os
+import queue
+import threading
+from collections import deque
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
+import numpy as np
 import torch
 from PIL import Image
 from surya.detection import DetectionPredictor
 from surya.recognition import RecognitionPredictor
 
+from .render import init_render_worker, render_page_samples, render_zoom
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_OCR_TARGET_HEIGHT = 1200
+# Sampled pages averaging fewer text characters than this (and mostly images) count as scanned
+SCANNED_MAX_CHARS_PER_PAGE = 100
+
+
+def _take_batch(source: queue.Queue, size: int) -> Tuple[List[Any], bool]:
+    """Block for up to size items from a stage queue; the flag is True once its None end marker was taken"""
+    items: List[Any] = []
+    while len(items) < size:
+        item = source.get()
+        if item is None:
+            return items, True
+        items.append(item)
+    return items, False
+
+
+def _iter_stage(source: queue.Queue) -> Iterator[Any]:
+    """Yield items from a stage queue until its None end marker"""
+    while True:
+        item = source.get()
+        if item is None:
+            return
+        yield item
+
+
+def _rasterize_stage(
+    pages: Iterable[Image.Image], raster_queue: queue.Queue, errors: List[Exception], stop: threading.Event
+):
+    """Push rendered pages to the detection stage until stopped, always ending with the None marker"""
+    try:
+        for image in pages:
+            if stop.is_set():
+                break
+            raster_queue.put(image)
+    except Exception as e:
+        errors.append(e)
+    finally:
+        raster_queue.put(None)
+
+
+def _configure_cpu_threads():
+    """Split all but one core between the processes running torch and keep inter-op parallelism small"""
+    # Set by the converter's pool workers so concurrent documents don't oversubscribe the cores
+    processes = max(1, int(os.environ.get("DOCS2MD_CPU_PROCESSES", "1")))
+    torch.set_num_threads(max(1, ((os.cpu_count() or 2) - 1) // processes))
+    try:
+        torch.set_num_interop_threads(2)
+    except RuntimeError:
+        # Can only be set once, before any inter-op parallel work has started in this process
+        pass
+
+
+def _cpu_supports_bf16() -> bool:
+    """Check whether the CPU has native bfloat16 support for oneDNN kernels"""
+    is_supported = getattr(torch.cpu, "_is_avx512_bf16_supported", None)
+    # Without the probe assume no support: oneDNN being available says nothing about bf16 hardware
+    return is_supported is not None and bool(is_supported())
+
+
+def _compile_predictor(predictor: Any):
+    """
+    Wrap a Surya predictor's model with torch.compile.
+
+    Compilation is lazy: it happens on the first forward pass, so a backend
+    that cannot compile the model fails there, inside process_with_ocr.
+    """
+    model = getattr(predictor, "model", None)
+    if model is not None:
+        predictor.model = torch.compile(model, dynamic=True)
+
+
+def _reading_order(lines: List[Any]) -> List[Any]:
+    """Sort text lines by y, then x, with a vectorized lexsort instead of a per-line key function"""
+    count = len(lines)
+    if count < 2:
+        return list(lines)
+    ys = np.fromiter((line.bbox[1] for line in lines), dtype=np.float64, count=count)
+    xs = np.fromiter((line.bbox[0] for line in lines), dtype=np.float64, count=count)
+    # lexsort sorts by the last key first and is stable, matching sorted() on (y, x)
+    return [lines[i] for i in np.lexsort((xs, ys))]
+
 
 class SuryaOCRProcessor:
     """Surya OCR processor for scanned PDFs"""
 
-    def __init__(self, device: Optional[torch.device] = None):
+    def __init__(self, device: Optional[torch.device] = None, target_height: int = DEFAULT_OCR_TARGET_HEIGHT):
+        # Rendered page height in pixels; Surya works best around 96-150 dpi
+        self.target_height = target_height
+        # Processes used to rasterize one PDF; documents are already spread across a process pool
+        self.render_workers = max(1, int(os.environ.get("DOCS2MD_OCR_RENDER_WORKERS", "1")))
+        # Pages of one document sent to each detection call
+        self.detect_batch = max(1, int(os.environ.get("DOCS2MD_OCR_DETECT_BATCH", "8")))
         # Force CPU for now to avoid MPS issues on macOS with Surya
         if device is None:
             if torch.cuda.is_available():
@@ -28,6 +124,8 @@ class SuryaOCRProcessor:
         self._models_loaded = False
         self.detection_predictor = None
         self.recognition_predictor = None
+        # Started on the first PDF rendered in parallel and reused for the following ones
+        self._render_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
 
     def _load_models(self):
         """Lazy load Surya models"""
@@ -35,123 +133,293 @@ class SuryaOCRProcessor:
             try:
                 logger.info("Loading Surya OCR models...")
                 # Set environment variable to force CPU usage if needed
-                import os
                 if self.device.type == "cpu":
                     os.environ["PYTORCH_DEVICE"] = "cpu"
-                
-                self.detection_predictor = DetectionPredictor()
-                self.recognition_predictor = RecognitionPredictor()
+                    _configure_cpu_threads()
+
+                optimize = os.environ.get("DOCS2MD_OCR_OPTIMIZE", "") == "1"
+                # bfloat16 is only worth it where the CPU has native support for it
+                dtype = torch.bfloat16 if optimize and self.device.type == "cpu" and _cpu_supports_bf16() else None
+                predictor_kwargs = {"dtype": dtype} if dtype is not None else {}
+
+                self.detection_predictor = DetectionPredictor(**predictor_kwargs)
+                self.recognition_predictor = RecognitionPredictor(**predictor_kwargs)
+                if optimize:
+                    _compile_predictor(self.detection_predictor)
+                    _compile_predictor(self.recognition_predictor)
                 self._models_loaded = True
                 logger.info(f"Surya OCR models loaded successfully on {self.device}")
             except Exception as e:
                 logger.error(f"Failed to load Surya OCR models: {e}")
                 raise RuntimeError(f"OCR model loading failed: {e}")
 
-    def is_scanned_pdf(self, pdf_path: Path, sample_pages: int = 3) -> bool:
+    def open_and_classify(self, pdf_path: Path, sample_pages: int = 3) -> Tuple[Optional[Any], bool]:
         """
-        Detect if a PDF is scanned (image-based) or contains extractable text.
+        Open a PDF once and detect if it is scanned (image-based) or contains extractable text.
+
+        The open document is returned so rasterization can reuse it; the caller owns it
+        and must close it.
 
         Args:
             pdf_path: Path to the PDF file
             sample_pages: Number of pages to sample for detection
 
         Returns:
-            True if the PDF appears to be scanned, False otherwise
+            Tuple of (open fitz document or None if it could not be opened, is_scanned)
         """
         try:
             import fitz  # PyMuPDF
 
             doc = fitz.open(str(pdf_path))
-            total_pages = min(len(doc), sample_pages)
-
-            if total_pages == 0:
-                return False
-
-            text_chars = 0
-            image_count = 0
+        except Exception as e:
+            logger.warning(f"Error detecting if PDF is scanned: {e}")
+            return None, False
 
-            for i in range(total_pages):
-                page = doc[i]
-                text = page.get_text().strip()
-                text_chars += len(text)
+        return doc, self.classify(doc, pdf_path, sample_pages)
 
-                # Count images on the page
-                image_list = page.get_images()
-                image_count += len(image_list)
+    def classify(self, doc, pdf_path: Path, sample_pages: int = 3) -> bool:
+        """Detect if an open PDF document is scanned, treating errors as not scanned"""
+        try:
+            return self._is_scanned_document(doc, pdf_path, sample_pages)
+        except Exception as e:
+            logger.warning(f"Error detecting if PDF is scanned: {e}")
+            return False
 
-            doc.close()
+    def _is_scanned_document(self, doc, pdf_path: Path, sample_pages: int) -> bool:
+        """Apply the scanned-PDF heuristic to an open document"""
+        total_pages = min(len(doc), sample_pages)
 
-            # Heuristic: If average text per page is very low but images exist,
-            # it's likely a scanned PDF
-            avg_text_per_page = text_chars / total_pages
-            avg_images_per_page = image_count / total_pages
+        if total_pages == 0:
+            return False
 
-            is_scanned = avg_text_per_page < 100 and avg_images_per_page >= 0.8
+        text_chars = 0
+        image_count = 0
+        digital_chars = SCANNED_MAX_CHARS_PER_PAGE * total_pages
 
-            if is_scanned:
-                logger.info(f"Detected scanned PDF: {pdf_path} (avg text: {avg_text_per_page:.1f} chars/page)")
+        for i in range(total_pages):
+            page = doc[i]
+            # Measure text blocks (type 0) rather than assembling the full page text
+            text_chars += sum(len(block[4].strip()) for block in page.get_text("blocks") if block[6] == 0)
+            if text_chars >= digital_chars:
+                # Enough text for the whole sample already, clearly not scanned
+                return False
 
-            return is_scanned
+            # Count images on the page
+            image_list = page.get_images(full=False)
+            image_count += len(image_list)
 
-        except Exception as e:
-            logger.warning(f"Error detecting if PDF is scanned: {e}")
-            return False
+        # Heuristic: If average text per page is very low but images exist,
+        # it's likely a scanned PDF
+        avg_text_per_page = text_chars / total_pages
+        avg_images_per_page = image_count / total_pages
 
-    def extract_images_from_pdf(self, pdf_path: Path) -> List[Image.Image]:
-        """Extract images from PDF pages"""
-        try:
-            import fitz
+        is_scanned = avg_text_per_page < SCANNED_MAX_CHARS_PER_PAGE and avg_images_per_page >= 0.8
 
-            doc = fitz.open(str(pdf_path))
-            images = []
+        if is_scanned:
+            logger.info(f"Detected scanned PDF: {pdf_path} (avg text: {avg_text_per_page:.1f} chars/page)")
 
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                # Render page as image
-                mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better quality
-                pix = page.get_pixmap(matrix=mat, alpha=False)
-                img_data = pix.tobytes("png")
+        return is_scanned
 
-                # Convert to PIL Image
-                import io
+    def is_scanned_pdf(self, pdf_path: Path, sample_pages: int = 3) -> bool:
+        """
+        Detect if a PDF is scanned (image-based) or contains extractable text.
 
-                img = Image.open(io.BytesIO(img_data))
-                images.append(img)
+        Args:
+            pdf_path: Path to the PDF file
+            sample_pages: Number of pages to sample for detection
 
+        Returns:
+            True if the PDF appears to be scanned, False otherwise
+        """
+        doc, is_scanned = self.open_and_classify(pdf_path, sample_pages)
+        if doc is not None:
             doc.close()
-            return images
+        return is_scanned
+
+    def iter_page_images(self, doc) -> Iterator[Image.Image]:
+        """
+        Lazily render pages of an open PDF document.
 
+        Only one page image is alive at a time unless the consumer keeps references.
+        With ``render_workers > 1`` pages of file-backed documents are rendered in
+        worker processes (PyMuPDF is not thread-safe) with a bounded look-ahead.
+        """
+        page_count = len(doc)
+        workers = min(self.render_workers, page_count)
+        if workers > 1 and doc.name and not doc.needs_pass:
+            yield from self._iter_page_images_parallel(doc.name, page_count, workers)
+            return
+
+        import fitz
+
+        # Pages of a document usually share a size, so matrices are reused per zoom level
+        matrices: Dict[float, Any] = {}
+        for page_num in range(page_count):
+            page = doc[page_num]
+            # Zoom so the page renders about target_height pixels tall, never above 2x
+            zoom = render_zoom(page.rect.height, self.target_height)
+            mat = matrices.get(zoom)
+            if mat is None:
+                mat = matrices[zoom] = fitz.Matrix(zoom, zoom)
+            # Render page as image
+            pix = page.get_pixmap(matrix=mat, alpha=False)
+
+            # Wrap the raw RGB samples directly, skipping a PNG encode/decode round-trip
+            yield Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+    def _iter_page_images_parallel(self, pdf_path: str, page_count: int, workers: int) -> Iterator[Image.Image]:
+        """Render pages across worker processes, yielding them in page order"""
+        executor = self._get_render_pool()
+        pending: Deque[concurrent.futures.Future] = deque()
+        try:
+            for page_num in range(page_count):
+                pending.append(executor.submit(render_page_samples, pdf_path, page_num, self.target_height))
+                # Keep a bounded number of rendered pages in flight
+                if len(pending) >= workers * 2:
+                    yield Image.frombytes("RGB", *pending.popleft().result())
+            while pending:
+                yield Image.frombytes("RGB", *pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _get_render_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Start the render worker processes on first use"""
+        if self._render_pool is None:
+            # Spawn rather than fork: this process is multithreaded and has torch loaded. Workers
+            # only import src.render, and stay up so later PDFs skip their start-up.
+            self._render_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.render_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_render_worker,
+            )
+        return self._render_pool
+
+    def close(self):
+        """Shut down the render worker processes, if any were started"""
+        if self._render_pool is not None:
+            self._render_pool.shutdown(cancel_futures=True)
+            self._render_pool = None
+
+    def extract_images_from_pdf(self, doc) -> List[Image.Image]:
+        """Extract images from the pages of an open PDF document"""
+        try:
+            return list(self.iter_page_images(doc))
         except Exception as e:
             logger.error(f"Error extracting images from PDF: {e}")
             return []
 
-    def process_with_ocr(self, pdf_path: Path, langs: Optional[List[str]] = None) -> Tuple[str, dict]:
+    def _run_ocr_stages(self, pages: Iterable[Image.Image]) -> List[Any]:
+        """
+        Run rasterize -> detect -> recognize as stages joined by bounded queues.
+
+        Stage 1 pulls rendered pages, stage 2 runs text detection on up to
+        ``detect_batch`` pages per call and stage 3 recognizes all detected pages
+        in one call, so rasterization overlaps with detection instead of running
+        before it. ``None`` marks the end of each stage's output.
+        """
+        raster_queue: queue.Queue = queue.Queue(maxsize=self.detect_batch * 2)
+        detect_queue: queue.Queue = queue.Queue(maxsize=self.detect_batch * 2)
+        errors: List[Exception] = []
+        stop = threading.Event()
+
+        stages = [
+            threading.Thread(
+                target=_rasterize_stage, args=(pages, raster_queue, errors, stop), name="ocr-rasterize", daemon=True
+            ),
+            threading.Thread(
+                target=self._detect_stage,
+                args=(raster_queue, detect_queue, errors, stop),
+                name="ocr-detect",
+                daemon=True,
+            ),
+        ]
+        for stage in stages:
+            stage.start()
+        try:
+            detected = list(_iter_stage(detect_queue))
+        except BaseException:
+            # Stop the stages and take the rest of their output so none stays blocked on a full queue
+            stop.set()
+            for _ in _iter_stage(detect_queue):
+                pass
+            raise
+        finally:
+            for stage in stages:
+                stage.join()
+
+        if errors:
+            raise errors[0]
+        # Recognition runs after the stage threads are joined, so its failures cannot leave them blocked
+        return self._recognize(detected)
+
+    def _detect_stage(
+        self, raster_queue: queue.Queue, detect_queue: queue.Queue, errors: List[Exception], stop: threading.Event
+    ):
+        """Detect text lines on batches of rendered pages, passing (image, polygons) pages on until stopped"""
+        finished = False
+        try:
+            while not finished and not stop.is_set():
+                # A short final batch is flushed as soon as the document's last page arrives
+                images, finished = _take_batch(raster_queue, self.detect_batch)
+                if images:
+                    for image, detection in zip(images, self.detection_predictor(images)):
+                        detect_queue.put((image, [box.polygon for box in detection.bboxes]))
+        except Exception as e:
+            errors.append(e)
+            # No point rendering pages that will never be detected
+            stop.set()
+        finally:
+            if not finished:
+                # Keep draining so the rasterizer never blocks on a full queue
+                for _ in _iter_stage(raster_queue):
+                    pass
+            detect_queue.put(None)
+
+    def _recognize(self, pages: List[Tuple[Image.Image, List]]) -> List[Any]:
+        """Recognize a document's (image, polygons) pages in one call, reusing the detected polygons"""
+        if not pages:
+            return []
+        images = [image for image, _ in pages]
+        polygons = [page_polygons for _, page_polygons in pages]
+        return self.recognition_predictor(images, polygons=polygons)
+
+    def _ocr_document(self, pdf_path: Path, doc=None) -> List[Any]:
+        """Open pdf_path unless doc is given, run the OCR stages over its pages and close it"""
+        if doc is None:
+            import fitz
+
+            doc = fitz.open(str(pdf_path))
+        try:
+            self._load_models()
+            # Rasterize and detect pages concurrently, then recognize them in one call
+            return self._run_ocr_stages(self.iter_page_images(doc))
+        finally:
+            doc.close()
+
+    def process_with_ocr(self, pdf_path: Path, langs: Optional[List[str]] = None, doc=None) -> Tuple[str, dict]:
         """
         Process a scanned PDF with Surya OCR.
 
         Args:
             pdf_path: Path to the PDF file
             langs: List of language codes (unused in current Surya API but kept for compatibility)
+            doc: Already open fitz document for pdf_path (e.g. from open_and_classify);
+                it is closed once processing finishes
 
         Returns:
             Tuple of (extracted_text, metadata)
         """
         try:
-            self._load_models()
-
             if langs is None:
                 langs = ["en"]
 
             logger.info(f"Processing {pdf_path} with Surya OCR")
 
-            # Extract images from PDF
-            images = self.extract_images_from_pdf(pdf_path)
-            if not images:
+            predictions = self._ocr_document(pdf_path, doc)
+            if not predictions:
                 return "", {"error": "No images could be extracted from PDF"}
 
-            # Run OCR on all pages using Surya
-            predictions = self.recognition_predictor(images, det_predictor=self.detection_predictor)
-
             # Combine text from all pages
             full_text = []
             page_texts = []
@@ -162,10 +430,7 @@ class SuryaOCRProcessor:
                 # Extract text from prediction
                 if hasattr(prediction, "text_lines"):
                     # Sort text lines by vertical position for better reading order
-                    sorted_lines = sorted(
-                        prediction.text_lines,
-                        key=lambda x: (x.bbox[1], x.bbox[0]),  # Sort by y, then x
-                    )
+                    sorted_lines = _reading_order(prediction.text_lines)
 
                     for line in sorted_lines:
                         if hasattr(line, "text") and line.text.strip():
@@ -184,11 +449,11 @@ class SuryaOCRProcessor:
                 "ocr_used": True,
                 "ocr_engine": "surya",
                 "languages": langs,
-                "page_count": len(images),
+                "page_count": len(predictions),
                 "page_texts": page_texts,
             }
 
-            logger.info(f"OCR completed for {pdf_path}: {len(images)} pages processed")
+            logger.info(f"OCR completed for {pdf_path}: {len(predictions)} pages processed")
 
             return combined_text, metadata
             
@@ -212,37 +477,161 @@ class OCRPlugin:
         """Process the file and return extracted text and metadata"""
         raise NotImplementedError
 
+    def close(self):
+        """Release resources kept across files; nothing by default"""
+
+
+class SharedPDF:
+    """
+    The PDF currently being checked, opened once and shared by the built-in plugins.
+
+    OCRManager hands one instance to every default plugin so the native text
+    check, scan detection and OCR rasterization all read the same open document.
+    """
+
+    def __init__(self):
+        self.path: Optional[Path] = None
+        self.doc: Optional[Any] = None
+
+    def get(self, path: Path):
+        """Return the open document for path, opening it (and closing any other) on first use"""
+        if self.doc is None or self.path != path:
+            import fitz  # PyMuPDF
+
+            self.close()
+            self.doc = fitz.open(str(path))
+            self.path = path
+        return self.doc
+
+    def take(self, path: Path) -> Optional[Any]:
+        """Hand the open document for path, if any, to the caller, who then owns and closes it"""
+        if self.doc is None or self.path != path:
+            return None
+        doc = self.doc
+        self.path, self.doc = None, None
+        return doc
+
+    def close(self):
+        """Close the open document, if any"""
+        if self.doc is not None:
+            self.doc.close()
+        self.path, self.doc = None, None
+
 
 class SuryaOCRPlugin(OCRPlugin):
     """Surya OCR plugin implementation"""
 
-    def __init__(self, device: Optional[torch.device] = None):
+    def __init__(
+        self,
+        device: Optional[torch.device] = None,
+        target_height: int = DEFAULT_OCR_TARGET_HEIGHT,
+        pdf: Optional[SharedPDF] = None,
+    ):
         super().__init__(device)
-        self.processor = SuryaOCRProcessor(device)
+        self.processor = SuryaOCRProcessor(device, target_height=target_height)
+        # Kept open from is_supported so process doesn't reopen the PDF
+        self.pdf = pdf if pdf is not None else SharedPDF()
 
     def is_supported(self, file_path: Path) -> bool:
         """Check if file is a scanned PDF"""
-        return file_path.suffix.lower() == ".pdf" and self.processor.is_scanned_pdf(file_path)
+        if file_path.suffix.lower() != ".pdf":
+            return False
+
+        try:
+            doc = self.pdf.get(file_path)
+        except Exception as e:
+            logger.warning(f"Error detecting if PDF is scanned: {e}")
+            return False
+        return self.processor.classify(doc, file_path)
 
     def process(self, file_path: Path, **kwargs) -> Tuple[str, dict]:
         """Process scanned PDF with OCR"""
         langs = kwargs.get("languages", ["en"])
-        return self.processor.process_with_ocr(file_path, langs)
+        # process_with_ocr closes the document, or opens its own when none was kept
+        return self.processor.process_with_ocr(file_path, langs, doc=self.pdf.take(file_path))
+
+    def close(self):
+        """Shut down the processor's render worker processes"""
+        self.processor.close()
+
+
+class NativeTextPlugin(OCRPlugin):
+    """Use the embedded text layer of born-digital PDFs directly, skipping the ML pipeline"""
+
+    def __init__(
+        self, device: Optional[torch.device] = None, min_chars_per_page: int = 400, pdf: Optional[SharedPDF] = None
+    ):
+        super().__init__(device)
+        self.min_chars_per_page = min_chars_per_page
+        self.pdf = pdf if pdf is not None else SharedPDF()
+        # (path, page texts) kept from is_supported so process doesn't read the text layer again
+        self._classified: Optional[Tuple[Path, List[str]]] = None
+
+    def _extract_page_texts(self, file_path: Path) -> List[str]:
+        """Extract the text layer of every page with PyMuPDF"""
+        return [page.get_text() for page in self.pdf.get(file_path)]
+
+    def is_supported(self, file_path: Path) -> bool:
+        """Check if file is a PDF with a dense enough text layer on average"""
+        self._classified = None
+        if file_path.suffix.lower() != ".pdf":
+            return False
+
+        try:
+            page_texts = self._extract_page_texts(file_path)
+        except Exception as e:
+            logger.warning(f"Error reading PDF text layer: {e}")
+            return False
+
+        if not page_texts:
+            return False
+
+        avg_text_per_page = sum(len(text.strip()) for text in page_texts) / len(page_texts)
+        if avg_text_per_page <= self.min_chars_per_page:
+            return False
+
+        self._classified = (file_path, page_texts)
+        return True
+
+    def process(self, file_path: Path, **kwargs) -> Tuple[str, dict]:
+        """Return the PDF text layer"""
+        if self._classified is not None and self._classified[0] == file_path:
+            page_texts = self._classified[1]
+            self._classified = None
+        else:
+            page_texts = self._extract_page_texts(file_path)
+
+        metadata = {"ocr_used": False, "engine": "pymupdf", "page_count": len(page_texts)}
+        return "\n\n".join(page_texts), metadata
 
 
 class OCRManager:
     """Manager for OCR plugins"""
 
-    def __init__(self, device: Optional[torch.device] = None, enable_ocr: bool = True):
+    def __init__(
+        self,
+        device: Optional[torch.device] = None,
+        enable_ocr: bool = True,
+        native_text: bool = False,
+        ocr_target_height: int = DEFAULT_OCR_TARGET_HEIGHT,
+    ):
         self.device = device
         self.plugins: List[OCRPlugin] = []
         self.enable_ocr = enable_ocr
-        if enable_ocr:
+        self.native_text = native_text
+        self.ocr_target_height = ocr_target_height
+        # Opened once per PDF for all the default plugins, closed once the PDF has been handled
+        self.pdf = SharedPDF()
+        if enable_ocr or native_text:
             self._register_default_plugins()
 
     def _register_default_plugins(self):
         """Register default OCR plugins"""
-        self.register_plugin(SuryaOCRPlugin(self.device))
+        # The native text layer is checked first: born-digital PDFs never reach OCR or marker
+        if self.native_text:
+            self.register_plugin(NativeTextPlugin(self.device, pdf=self.pdf))
+        if self.enable_ocr:
+            self.register_plugin(SuryaOCRPlugin(self.device, target_height=self.ocr_target_height, pdf=self.pdf))
 
     def register_plugin(self, plugin: OCRPlugin):
         """Register a new OCR plugin"""
@@ -255,9 +644,22 @@ class OCRManager:
         Returns:
             Tuple of (text, metadata) if OCR was used, None otherwise
         """
-        if not self.enable_ocr:
+        if not (self.enable_ocr or self.native_text):
             return None
-            
+
+        try:
+            return self._process_with_plugins(file_path, **kwargs)
+        finally:
+            self.pdf.close()
+
+    def close(self):
+        """Release what the plugins keep across files, such as OCR render worker processes"""
+        self.pdf.close()
+        for plugin in self.plugins:
+            plugin.close()
+
+    def _process_with_plugins(self, file_path: Path, **kwargs) -> Optional[Tuple[str, dict]]:
+        """Return the result of the first plugin that supports file_path and processes it without error"""
         for plugin in self.plugins:
             try:
                 if plugin.is_supported(file_path):
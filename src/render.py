@@ -0,0 +1,56 @@
+"""Page rasterization run inside OCR render worker processes
+
+Kept apart from ocr.py so spawned workers only import PyMuPDF, not torch or Surya.
+"""
+
+import multiprocessing.util
+from typing import Any, Optional, Tuple
+
+MAX_RENDER_ZOOM = 2.0
+
+# Document a render worker process is rendering, kept open across its pages and replaced on the next PDF
+_RENDER_DOC: Optional[Any] = None
+_RENDER_PATH: Optional[str] = None
+
+
+def render_zoom(page_height: float, target_height: int) -> float:
+    """Zoom so a page renders about target_height pixels tall, never above MAX_RENDER_ZOOM"""
+    if page_height <= 0:
+        return MAX_RENDER_ZOOM
+    return min(MAX_RENDER_ZOOM, target_height / page_height)
+
+
+def init_render_worker():
+    """Close the worker's open document when the worker process exits"""
+    # Pool workers leave through multiprocessing's exit hook rather than atexit
+    multiprocessing.util.Finalize(None, _close_render_doc, exitpriority=0)
+
+
+def _close_render_doc():
+    """Close the document the worker has open, if any"""
+    global _RENDER_DOC, _RENDER_PATH
+    if _RENDER_DOC is not None:
+        _RENDER_DOC.close()
+    _RENDER_DOC, _RENDER_PATH = None, None
+
+
+def _render_doc(pdf_path: str):
+    """Return the open document for pdf_path, closing the previous PDF the worker rendered"""
+    global _RENDER_DOC, _RENDER_PATH
+    if _RENDER_PATH != pdf_path:
+        import fitz
+
+        _close_render_doc()
+        _RENDER_DOC = fitz.open(pdf_path)
+        _RENDER_PATH = pdf_path
+    return _RENDER_DOC
+
+
+def render_page_samples(pdf_path: str, page_num: int, target_height: int) -> Tuple[Tuple[int, int], bytes]:
+    """Render one page inside a render worker process and return its size and RGB samples"""
+    import fitz
+
+    page = _render_doc(pdf_path)[page_num]
+    zoom = render_zoom(page.rect.height, target_height)
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    return (pix.width, pix.height), pix.samples
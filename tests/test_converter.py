@@ -1,30 +1,46 @@
+import concurrent.futures
+import gc
 import json
-import shutil
-import tempfile
+import multiprocessing
+import os
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import docx
+import pptx
 import pytest
 
-from src.converter import ConversionResult, DocumentConverter
+from src import converter as converter_module
+from src.converter import ConversionResult, DocumentConverter, _convert_one, _get_models, _heading_prefix, _worker_init
+
+
+def make_docx(path: Path, build=None) -> Path:
+    """Save a real DOCX file, optionally filled in by build(document)"""
+    document = docx.Document()
+    if build is not None:
+        build(document)
+    document.save(path)
+    return path
+
+
+class FakeShapes(list):
+    """Slide shape collection with the title placeholder attribute python-pptx provides"""
+
+    def __init__(self, shapes, title=None):
+        super().__init__(shapes)
+        self.title = title
 
 
 class TestDocumentConverter:
     """Test suite for DocumentConverter"""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests"""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
-    @pytest.fixture
-    def converter(self, temp_dir):
+    def converter(self, tmp_path):
         """Create a converter instance"""
-        return DocumentConverter(output_dir=temp_dir)
+        return DocumentConverter(output_dir=tmp_path)
 
-    def test_get_output_paths_with_output_dir(self, converter, temp_dir):
+    def test_get_output_paths_with_output_dir(self, converter, tmp_path):
         """Test output path generation with output directory"""
         input_path = Path("/some/path/document.pdf")
         md_path, json_path = converter._get_output_paths(input_path)
@@ -32,7 +48,7 @@ class TestDocumentConverter:
         assert md_path.suffix == ".md"
         assert json_path.suffix == ".json"
         assert md_path.parent == json_path.parent
-        assert str(temp_dir) in str(md_path)
+        assert str(tmp_path) in str(md_path)
 
     def test_get_output_paths_without_output_dir(self):
         """Test output path generation without output directory"""
@@ -43,36 +59,47 @@ class TestDocumentConverter:
         assert md_path == Path("/some/path/document.md")
         assert json_path == Path("/some/path/document.json")
 
-    def test_find_documents_single_file(self, converter, temp_dir):
+    def test_find_documents_single_file(self, converter, tmp_path):
         """Test finding documents with single file"""
-        test_file = temp_dir / "test.pdf"
+        test_file = tmp_path / "test.pdf"
         test_file.touch()
 
         documents = converter.find_documents(test_file)
         assert len(documents) == 1
         assert documents[0] == test_file
 
-    def test_find_documents_directory(self, converter, temp_dir):
+    def test_find_documents_directory(self, converter, tmp_path):
         """Test finding documents in directory"""
         # Create test files
-        (temp_dir / "doc1.pdf").touch()
-        (temp_dir / "doc2.docx").touch()
-        (temp_dir / "doc3.pptx").touch()
-        (temp_dir / "ignore.txt").touch()
+        (tmp_path / "doc1.pdf").touch()
+        (tmp_path / "doc2.docx").touch()
+        (tmp_path / "doc3.pptx").touch()
+        (tmp_path / "ignore.txt").touch()
 
-        subdir = temp_dir / "subdir"
+        subdir = tmp_path / "subdir"
         subdir.mkdir()
         (subdir / "doc4.pdf").touch()
 
-        documents = converter.find_documents(temp_dir)
+        documents = converter.find_documents(tmp_path)
         assert len(documents) == 4
         assert all(doc.suffix in [".pdf", ".docx", ".pptx"] for doc in documents)
 
+    def test_iter_documents_streams_in_sorted_order(self, converter, tmp_path):
+        """Test documents are yielded lazily, in the same order as sorting all paths"""
+        for name in ["b.pdf", "a/z.docx", "a/b/c.pptx", "a.pptx", "B.docx"]:
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).touch()
+
+        documents = converter.iter_documents(tmp_path)
+
+        assert next(documents) == tmp_path / "B.docx"
+        assert [tmp_path / "B.docx", *documents] == sorted(converter.find_documents(tmp_path))
+
     @patch("src.converter.text_from_rendered")
     @patch("src.converter.PdfConverter")
     @patch("src.converter.create_model_dict")
     def test_convert_pdf_success(
-        self, mock_create_model_dict, mock_pdf_converter_class, mock_text_from_rendered, converter, temp_dir
+        self, mock_create_model_dict, mock_pdf_converter_class, mock_text_from_rendered, converter, tmp_path
     ):
         """Test successful PDF conversion"""
         # Setup mocks
@@ -83,7 +110,7 @@ class TestDocumentConverter:
         mock_text_from_rendered.return_value = ("# Test Content\nThis is test content.", None, [])
 
         # Create test PDF
-        test_pdf = temp_dir / "test.pdf"
+        test_pdf = tmp_path / "test.pdf"
         test_pdf.touch()
 
         # Convert
@@ -105,8 +132,22 @@ class TestDocumentConverter:
         # Should have ocr_used metadata from the new implementation
         assert "ocr_used" in json_content["metadata"]
 
+    @patch("src.converter.PdfConverter")
+    @patch("src.converter.create_model_dict")
+    def test_marker_models_loaded_once(self, mock_create_model_dict, mock_pdf_converter_class, tmp_path):
+        """Test PDF converters in one process share a single marker model dict"""
+        _get_models.cache_clear()
+        try:
+            DocumentConverter(output_dir=tmp_path)._load_pdf_converter()
+            DocumentConverter(output_dir=tmp_path)._load_pdf_converter()
+        finally:
+            _get_models.cache_clear()
+
+        mock_create_model_dict.assert_called_once()
+        assert mock_pdf_converter_class.call_count == 2
+
     @patch("src.ocr.OCRManager.process_if_needed")
-    def test_convert_pdf_with_ocr(self, mock_ocr_process, converter, temp_dir):
+    def test_convert_pdf_with_ocr(self, mock_ocr_process, converter, tmp_path):
         """Test PDF conversion with OCR"""
         # Mock OCR processing
         mock_ocr_process.return_value = (
@@ -120,7 +161,7 @@ class TestDocumentConverter:
         )
 
         # Create test PDF
-        test_pdf = temp_dir / "test.pdf"
+        test_pdf = tmp_path / "test.pdf"
         test_pdf.touch()
 
         # Convert
@@ -144,7 +185,25 @@ class TestDocumentConverter:
         assert json_content["images"] == 2
 
     @patch("src.ocr.OCRManager.process_if_needed")
-    def test_convert_pdf_no_ocr_needed(self, mock_ocr_process, converter, temp_dir):
+    def test_convert_pdf_native_text(self, mock_ocr_process, converter, tmp_path):
+        """Test PDFs served from their text layer are not reported as OCR and have no images"""
+        mock_ocr_process.return_value = (
+            "Page one\n\nPage two",
+            {"ocr_used": False, "engine": "pymupdf", "page_count": 2},
+        )
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.touch()
+
+        result = converter.convert_pdf(test_pdf)
+
+        assert result.status == "success"
+        assert result.metadata == {"ocr_used": False, "engine": "pymupdf", "page_count": 2}
+        json_content = json.loads(Path(result.json_path).read_text())
+        assert json_content["content"] == "Page one\n\nPage two"
+        assert json_content["images"] == 0
+
+    @patch("src.ocr.OCRManager.process_if_needed")
+    def test_convert_pdf_no_ocr_needed(self, mock_ocr_process, converter, tmp_path):
         """Test PDF conversion when OCR is not needed"""
         # Mock OCR not needed
         mock_ocr_process.return_value = None
@@ -160,7 +219,7 @@ class TestDocumentConverter:
             mock_text_from_rendered.return_value = ("# Regular Content", None, [])
 
             # Create test PDF
-            test_pdf = temp_dir / "test.pdf"
+            test_pdf = tmp_path / "test.pdf"
             test_pdf.touch()
 
             # Convert
@@ -173,12 +232,12 @@ class TestDocumentConverter:
 
     @patch("src.converter.PdfConverter")
     @patch("src.converter.create_model_dict")
-    def test_convert_pdf_error(self, mock_create_model_dict, mock_pdf_converter_class, converter, temp_dir):
+    def test_convert_pdf_error(self, mock_create_model_dict, mock_pdf_converter_class, converter, tmp_path):
         """Test PDF conversion error handling"""
         mock_create_model_dict.return_value = {}
         mock_pdf_converter_class.side_effect = Exception("PDF conversion failed")
 
-        test_pdf = temp_dir / "test.pdf"
+        test_pdf = tmp_path / "test.pdf"
         test_pdf.touch()
 
         result = converter.convert_pdf(test_pdf)
@@ -188,35 +247,16 @@ class TestDocumentConverter:
         assert result.markdown_path == ""
         assert result.json_path == ""
 
-    @patch("src.converter.Document")
-    def test_convert_docx_success(self, mock_document_class, converter, temp_dir):
+    def test_convert_docx_success(self, converter, tmp_path):
         """Test successful DOCX conversion"""
-        # Setup mock document
-        mock_doc = Mock()
-        mock_document_class.return_value = mock_doc
 
-        # Mock paragraphs
-        para1 = Mock()
-        para1.text = "Test Title"
-        para1.style.name = "Heading 1"
-        para1.runs = []
+        def build(document):
+            document.add_heading("Test Title", level=1)
+            document.add_paragraph("Normal text")
+            document.core_properties.author = "Test Author"
+            document.core_properties.title = "Test Title"
 
-        para2 = Mock()
-        para2.text = "Normal text"
-        para2.style.name = "Normal"
-        para2.runs = []
-
-        mock_doc.paragraphs = [para1, para2]
-
-        # Mock properties
-        mock_doc.core_properties.author = "Test Author"
-        mock_doc.core_properties.title = "Test Title"
-        mock_doc.core_properties.created = None
-        mock_doc.core_properties.modified = None
-
-        # Create test file
-        test_docx = temp_dir / "test.docx"
-        test_docx.touch()
+        test_docx = make_docx(tmp_path / "test.docx", build)
 
         # Convert
         result = converter.convert_docx(test_docx)
@@ -229,36 +269,94 @@ class TestDocumentConverter:
         assert "# Test Title" in md_content
         assert "Normal text" in md_content
 
-    @patch("src.converter.Presentation")
-    def test_convert_pptx_success(self, mock_presentation_class, converter, temp_dir):
-        """Test successful PPTX conversion"""
-        # Setup mock presentation
-        mock_prs = Mock()
-        mock_presentation_class.return_value = mock_prs
+        json_content = json.loads(Path(result.json_path).read_text())
+        assert json_content["blocks"] == [
+            {"type": "heading", "level": 1, "text": "Test Title"},
+            {"type": "paragraph", "text": "Normal text"},
+        ]
+
+    def test_heading_prefix(self):
+        """Test heading styles map to markdown prefixes, including non-standard names"""
+        assert _heading_prefix("Heading 2") == "## "
+        assert _heading_prefix("heading 3") == "### "
+        assert _heading_prefix("Heading") == "# "
+        assert _heading_prefix("Normal") is None
+
+    def test_convert_docx_run_formatting(self, converter, tmp_path):
+        """Test bold/italic runs are wrapped individually, even when runs share text"""
+
+        def build(document):
+            para = document.add_paragraph()
+            for text, bold, italic in [
+                ("word", False, False),
+                (" ", True, False),
+                ("word", True, False),
+                (" and ", False, False),
+                ("it", False, True),
+            ]:
+                run = para.add_run(text)
+                run.bold = bold
+                run.italic = italic
+
+        test_docx = make_docx(tmp_path / "test.docx", build)
+
+        result = converter.convert_docx(test_docx)
+
+        assert result.status == "success"
+        assert Path(result.markdown_path).read_text() == "word **word** and *it*"
+
+    def test_json_output_pretty_flag(self, tmp_path):
+        """Test JSON output is compact by default and indented with pretty_json"""
+        test_docx = make_docx(tmp_path / "test.docx")
+
+        compact = DocumentConverter(output_dir=tmp_path / "compact").convert_docx(test_docx)
+        pretty = DocumentConverter(output_dir=tmp_path / "pretty", pretty_json=True).convert_docx(test_docx)
 
-        # Mock slide
-        mock_slide = Mock()
-        mock_shape = Mock()
-        mock_shape.text = "Slide Title"
+        compact_text = Path(compact.json_path).read_text()
+        pretty_text = Path(pretty.json_path).read_text()
+        assert "\n" not in compact_text
+        assert '\n  "type": "docx"' in pretty_text
+        assert json.loads(compact_text) == json.loads(pretty_text)
 
-        # Create a mock shapes collection
-        mock_shapes = Mock()
-        mock_shapes.__iter__ = Mock(return_value=iter([mock_shape]))
-        mock_shapes.title = mock_shape
+    def test_dump_json_without_orjson(self, converter):
+        """Test the stdlib fallback matches orjson's compact UTF-8 output"""
+        with patch.object(converter_module, "orjson", None):
+            data = converter._dump_json({"content": "café", "metadata": {}})
 
-        mock_slide.shapes = mock_shapes
-        mock_slide.has_notes_slide = False
+        assert data == '{"content":"café","metadata":{}}'.encode("utf-8")
 
-        mock_prs.slides = [mock_slide]
+    def test_ensure_dirs_creates_each_directory_once(self, converter, tmp_path):
+        """Test output directories are only created the first time they are needed"""
+        md_dir = tmp_path / "output" / "md"
+        with patch("src.converter.os.makedirs") as mock_makedirs:
+            converter._ensure_dirs([md_dir, md_dir])
+            converter._ensure_dirs([md_dir])
 
-        # Mock properties
-        mock_prs.core_properties.title = "Test Presentation"
-        mock_prs.core_properties.author = "Test Author"
-        mock_prs.core_properties.created = None
-        mock_prs.core_properties.modified = None
+        mock_makedirs.assert_called_once_with(md_dir, exist_ok=True)
+
+    def test_skip_mkdir_leaves_directories_to_parent(self, tmp_path):
+        """Test pool-worker converters do not create output directories themselves"""
+        converter = DocumentConverter(output_dir=tmp_path / "output", skip_mkdir=True)
+        with patch("src.converter.os.makedirs") as mock_makedirs:
+            converter._ensure_dirs([tmp_path / "output" / "md"])
+
+        mock_makedirs.assert_not_called()
+
+    @patch("src.converter.Presentation")
+    def test_convert_pptx_success(self, mock_presentation_class, converter, tmp_path):
+        """Test successful PPTX conversion"""
+        # Plain fakes for the presentation tree; only the constructor needs to be a mock
+        title_shape = SimpleNamespace(text="Slide Title", has_text_frame=True)
+        slide = SimpleNamespace(shapes=FakeShapes([title_shape], title=title_shape), has_notes_slide=False)
+        mock_presentation_class.return_value = SimpleNamespace(
+            slides=[slide],
+            core_properties=SimpleNamespace(
+                title="Test Presentation", author="Test Author", created=None, modified=None
+            ),
+        )
 
         # Create test file
-        test_pptx = temp_dir / "test.pptx"
+        test_pptx = tmp_path / "test.pptx"
         test_pptx.touch()
 
         # Convert
@@ -272,9 +370,36 @@ class TestDocumentConverter:
         assert "# Slide 1" in md_content
         assert "## Slide Title" in md_content
 
-    def test_convert_document_unsupported(self, converter, temp_dir):
+    def test_convert_pptx_fast_matches_python_pptx(self, tmp_path):
+        """Test the zip/XML PPTX reader produces the same output as python-pptx"""
+        prs = pptx.Presentation()
+        prs.core_properties.author = "Test Author"
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = "Slide Title"
+        slide.placeholders[1].text = "First point\nSecond point"
+        slide.notes_slide.notes_text_frame.text = "Speaker notes"
+        table_slide = prs.slides.add_slide(prs.slide_layouts[5])
+        table_slide.shapes.title.text = "Table"
+        table_slide.shapes.add_table(1, 1, 0, 0, 100, 100).table.cell(0, 0).text = "skipped"
+        test_pptx = tmp_path / "test.pptx"
+        prs.save(test_pptx)
+
+        outputs = []
+        for fast_pptx in (False, True):
+            converter = DocumentConverter(output_dir=tmp_path / str(fast_pptx), fast_pptx=fast_pptx)
+            result = converter.convert_pptx(test_pptx)
+            assert result.status == "success"
+            outputs.append((Path(result.markdown_path).read_text(), result.metadata))
+
+        assert outputs[0] == outputs[1]
+        assert "## Slide Title\n\nFirst point\nSecond point" in outputs[1][0]
+        assert "**Notes:**\n\nSpeaker notes" in outputs[1][0]
+        assert "skipped" not in outputs[1][0]
+        assert outputs[1][1]["slide_count"] == 2
+
+    def test_convert_document_unsupported(self, converter, tmp_path):
         """Test converting unsupported document type"""
-        test_file = temp_dir / "test.txt"
+        test_file = tmp_path / "test.txt"
         test_file.touch()
 
         result = converter.convert_document(test_file)
@@ -285,12 +410,14 @@ class TestDocumentConverter:
     @patch("src.converter.DocumentConverter.convert_pdf")
     @patch("src.converter.DocumentConverter.convert_docx")
     @patch("src.converter.DocumentConverter.convert_pptx")
-    def test_convert_all(self, mock_pptx, mock_docx, mock_pdf, converter, temp_dir):
+    def test_convert_all(self, mock_pptx, mock_docx, mock_pdf, tmp_path):
         """Test converting multiple documents"""
-        # Create test files
-        (temp_dir / "test1.pdf").touch()
-        (temp_dir / "test2.docx").touch()
-        (temp_dir / "test3.pptx").touch()
+        converter = DocumentConverter(output_dir=tmp_path)
+
+        # Create test files; empty files and PDFs without a header are rejected before conversion
+        (tmp_path / "test1.pdf").write_bytes(b"%PDF-1.4\n")
+        (tmp_path / "test2.docx").write_bytes(b"PK")
+        (tmp_path / "test3.pptx").write_bytes(b"PK")
 
         # Setup mocks to return success
         mock_pdf.return_value = ConversionResult(
@@ -303,8 +430,8 @@ class TestDocumentConverter:
             source_path="test3.pptx", markdown_path="test3.md", json_path="test3.json", status="success"
         )
 
-        # Convert all
-        results = converter.convert_all(temp_dir)
+        # Convert all; mocks are not visible inside worker processes, so convert serially
+        results = converter.convert_all(tmp_path, parallel=False)
 
         # Verify
         assert len(results) == 3
@@ -313,6 +440,249 @@ class TestDocumentConverter:
         assert mock_docx.called
         assert mock_pptx.called
 
+    def test_convert_all_async_io_writes_behind(self, tmp_path):
+        """Test background writes complete and write failures are reported as errors"""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for name in ("a", "b", "c"):
+            make_docx(input_dir / f"{name}.docx", lambda document, name=name: document.add_paragraph(name))
+        converter = DocumentConverter(output_dir=tmp_path / "output", parallel=False, async_io=True)
+        # A directory where b's markdown should go makes its write fail
+        blocked_md, _ = converter._get_output_paths(input_dir / "b.docx")
+        blocked_md.mkdir(parents=True)
+
+        results = converter.convert_all(input_dir)
+
+        assert [(Path(r.source_path).name, r.status) for r in results] == [
+            ("a.docx", "success"),
+            ("b.docx", "error"),
+            ("c.docx", "success"),
+        ]
+        assert Path(results[2].markdown_path).read_text() == "c"
+        assert converter._writer is None
+
+    def test_convert_all_jsonl_output(self, tmp_path):
+        """Test --jsonl collects one record per converted document instead of JSON sidecars"""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for name in ("a", "b"):
+            make_docx(input_dir / f"{name}.docx", lambda document, name=name: document.add_paragraph(name))
+        output_dir = tmp_path / "output"
+        jsonl_path = output_dir / "records.jsonl"
+
+        results = DocumentConverter(output_dir=output_dir, parallel=False, jsonl_path=jsonl_path).convert_all(input_dir)
+        records = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+
+        assert [(Path(r["source"]).name, r["content"]) for r in records] == [("a.docx", "a"), ("b.docx", "b")]
+        assert all(r.json_path == str(jsonl_path) for r in results)
+        assert not (output_dir / "json").exists()
+
+        # Reruns rewrite the file from scratch: no duplicate records, none for deleted sources
+        (input_dir / "b.docx").unlink()
+        rerun = DocumentConverter(output_dir=output_dir, parallel=False, jsonl_path=jsonl_path).convert_all(input_dir)
+        records = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+
+        assert [r.status for r in rerun] == ["success"]
+        assert [(Path(r["source"]).name, r["content"]) for r in records] == [("a.docx", "a")]
+
+    @pytest.mark.parametrize("found", [False, True], ids=["nothing_found", "conversion_fails"])
+    def test_convert_all_jsonl_closed(self, tmp_path, found):
+        """Test the JSON Lines file is closed when no documents are found or conversion raises"""
+        if found:
+            (tmp_path / "test.docx").write_bytes(b"PK")
+        converter = DocumentConverter(output_dir=tmp_path / "out", parallel=False, jsonl_path=tmp_path / "r.jsonl")
+
+        with patch.object(DocumentConverter, "_convert", side_effect=RuntimeError("boom")):
+            if found:
+                with pytest.raises(RuntimeError, match="boom"):
+                    converter.convert_all(tmp_path)
+            else:
+                assert converter.convert_all(tmp_path) == []
+
+        assert converter._jsonl_fd is None
+
+    @pytest.mark.parametrize("async_io", [False, True], ids=["sync", "write_behind"])
+    def test_convert_all_jsonl_skips_failed_writes(self, tmp_path, async_io):
+        """Test a document whose markdown could not be written gets no JSON Lines record"""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        make_docx(input_dir / "a.docx", lambda document: document.add_paragraph("a"))
+        jsonl_path = tmp_path / "records.jsonl"
+        converter = DocumentConverter(
+            output_dir=tmp_path / "output", parallel=False, async_io=async_io, jsonl_path=jsonl_path
+        )
+
+        with patch("src.converter._write_files", side_effect=OSError("disk full")):
+            results = converter.convert_all(input_dir)
+
+        assert [r.status for r in results] == ["error"]
+        assert jsonl_path.read_text() == ""
+
+    @patch("src.converter.Document", side_effect=docx.Document)
+    def test_convert_all_skips_unchanged_documents(self, mock_document_class, tmp_path):
+        """Test reruns reuse outputs of documents whose content hash is unchanged"""
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        test_docx = make_docx(input_dir / "test.docx", lambda document: document.add_paragraph("version 1"))
+        output_dir = tmp_path / "output"
+
+        first = DocumentConverter(output_dir=output_dir, parallel=False).convert_all(input_dir)
+        second = DocumentConverter(output_dir=output_dir, parallel=False).convert_all(input_dir)
+        make_docx(test_docx, lambda document: document.add_paragraph("version 2"))
+        third = DocumentConverter(output_dir=output_dir, parallel=False).convert_all(input_dir)
+
+        assert [r.status for r in first + second + third] == ["success", "cached", "success"]
+        assert second[0].markdown_path == first[0].markdown_path
+        assert mock_document_class.call_count == 2
+        assert (output_dir / ".manifest.json").exists()
+
+        uncached = DocumentConverter(output_dir=output_dir, parallel=False, use_cache=False).convert_all(input_dir)
+        assert uncached[0].status == "success"
+
+    @patch("src.converter.DocumentConverter.convert_pdf")
+    @patch("src.converter.DocumentConverter.convert_docx")
+    def test_convert_document_rejects_empty_and_headerless_files(self, mock_docx, mock_pdf, converter, tmp_path):
+        """Test empty files and PDFs without a header fail before any converter runs"""
+        (tmp_path / "empty.docx").touch()
+        (tmp_path / "empty.pdf").touch()
+        (tmp_path / "fake.pdf").write_bytes(b"<html></html>")
+
+        results = [converter.convert_document(tmp_path / name) for name in ("empty.docx", "empty.pdf", "fake.pdf")]
+
+        assert [r.error for r in results] == ["Empty file", "Empty file", "Not a PDF file (missing %PDF- header)"]
+        assert all(r.status == "error" for r in results)
+        mock_docx.assert_not_called()
+        mock_pdf.assert_not_called()
+
+    def test_convert_one_reuses_worker_converter(self, converter, tmp_path, monkeypatch):
+        """Test the process-pool worker builds its converter once in the initializer"""
+        test_file = tmp_path / "test.txt"
+        test_file.touch()
+        monkeypatch.delenv("DOCS2MD_CPU_PROCESSES", raising=False)
+
+        _worker_init(converter._config, processes=3)
+        worker_converter = converter_module._WORKER_CONVERTER
+        first = _convert_one(str(test_file))
+        second = _convert_one(str(test_file))
+
+        assert first.status == "error"
+        assert "Unsupported file type" in second.error
+        assert converter_module._WORKER_CONVERTER is worker_converter
+        assert worker_converter.output_dir == tmp_path
+        assert worker_converter.parallel is False
+        # Surya sizes its torch thread pool from the number of worker processes
+        assert os.environ["DOCS2MD_CPU_PROCESSES"] == "3"
+
+    @pytest.fixture
+    def thread_pool(self, monkeypatch):
+        """Run process pools on a single thread, recording pool initargs, submitted paths and other calls"""
+        record = SimpleNamespace(initargs=[], submitted=[], calls=[])
+
+        def make_pool(max_workers, mp_context, initializer, initargs):
+            # Threads see the patched converter methods, unlike worker processes
+            record.initargs.append(initargs)
+            executor = concurrent.futures.ThreadPoolExecutor(1, initializer=initializer, initargs=initargs)
+            submit = executor.submit
+
+            def tracking_submit(fn, *args):
+                if fn is converter_module._convert_one:
+                    record.submitted.append(args[0])
+                else:
+                    record.calls.append(fn)
+                return submit(fn, *args)
+
+            executor.submit = tracking_submit
+            return executor
+
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", make_pool)
+        monkeypatch.setattr(converter_module, "_WORKER_CONVERTER", None)
+        monkeypatch.delenv("DOCS2MD_CPU_PROCESSES", raising=False)
+        return record
+
+    def test_convert_all_bounds_inflight_documents(self, tmp_path, thread_pool):
+        """Test parallel conversion keeps at most max_inflight documents submitted"""
+        for i in range(5):
+            (tmp_path / f"test{i}.docx").write_bytes(b"PK")
+        converter = DocumentConverter(output_dir=tmp_path / "out", max_inflight=2)
+        completed = []
+
+        def convert(path):
+            assert len(thread_pool.submitted) - len(completed) <= 2
+            completed.append(path)
+            return ConversionResult(source_path=str(path), markdown_path="", json_path="", status="success")
+
+        with patch.object(DocumentConverter, "convert_docx", side_effect=convert):
+            results = converter.convert_all(tmp_path)
+
+        assert len(results) == 5
+        assert len(thread_pool.submitted) == 5
+
+    def test_convert_all_loads_models_before_forking(self, tmp_path, thread_pool):
+        """Test fork pools get the marker models from the parent rather than loading them per worker"""
+        for i in range(2):
+            (tmp_path / f"test{i}.pdf").write_bytes(b"%PDF-1.4\n")
+        converter = DocumentConverter(output_dir=tmp_path / "out")
+        pools_at_load = []
+
+        def load_models():
+            pools_at_load.append(len(thread_pool.initargs))
+
+        def convert(path):
+            return ConversionResult(source_path=str(path), markdown_path="", json_path="", status="success")
+
+        with patch("src.converter._pool_context", return_value=multiprocessing.get_context("fork")):
+            with patch("src.converter._get_models", side_effect=load_models):
+                with patch.object(DocumentConverter, "convert_pdf", side_effect=convert):
+                    results = converter.convert_all(tmp_path)
+
+        assert [r.status for r in results] == ["success", "success"]
+        # Loaded once, in the parent, before the pool exists
+        assert pools_at_load == [0]
+        assert gc.get_freeze_count() == 0
+
+    def test_convert_all_forks_workers_before_progress(self, tmp_path, thread_pool, monkeypatch):
+        """Test fork pools have every worker started, after gc.freeze, before the progress refresh thread runs"""
+        for i in range(2):
+            (tmp_path / f"test{i}.docx").write_bytes(b"PK")
+        converter = DocumentConverter(output_dir=tmp_path / "out")
+        at_start = []
+        start = converter_module.Progress.start
+
+        def tracking_start(progress):
+            at_start.append((len(thread_pool.initargs), len(thread_pool.calls), gc.get_freeze_count() > 0))
+            start(progress)
+
+        def convert(path):
+            return ConversionResult(source_path=str(path), markdown_path="", json_path="", status="success")
+
+        monkeypatch.setattr(converter_module.Progress, "start", tracking_start)
+        with patch("src.converter._pool_context", return_value=multiprocessing.get_context("fork")):
+            with patch.object(DocumentConverter, "convert_docx", side_effect=convert):
+                converter.convert_all(tmp_path)
+
+        assert at_start == [(1, 1, True)]
+        assert gc.get_freeze_count() == 0
+
+    def test_convert_all_keeps_pdfs_in_parent_on_cuda(self, tmp_path, thread_pool):
+        """Test CUDA runs convert PDFs in the parent with one copy of the models and pool the rest"""
+        for name in ("a.pdf", "b.docx", "c.pdf", "d.docx"):
+            (tmp_path / name).write_bytes(b"%PDF-1.4\n" if name.endswith(".pdf") else b"PK")
+        converter = DocumentConverter(output_dir=tmp_path / "out")
+        converter.device = SimpleNamespace(type="cuda")
+
+        def convert(path):
+            return ConversionResult(source_path=str(path), markdown_path="", json_path="", status="success")
+
+        with patch("src.converter._get_models") as mock_get_models:
+            with patch.object(DocumentConverter, "convert_pdf", side_effect=convert):
+                with patch.object(DocumentConverter, "convert_docx", side_effect=convert):
+                    results = converter.convert_all(tmp_path)
+
+        assert sorted(Path(r.source_path).name for r in results) == ["a.pdf", "b.docx", "c.pdf", "d.docx"]
+        assert sorted(Path(path).name for path in thread_pool.submitted) == ["b.docx", "d.docx"]
+        # Spawned workers are not asked to load the models at startup
+        mock_get_models.assert_not_called()
+
 
 class TestConversionResult:
     """Test ConversionResult dataclass"""
@@ -347,18 +717,10 @@ class TestFolderStructurePreservation:
     """Test that folder structure is preserved when converting directories"""
 
     @pytest.fixture
-    def nested_temp_dir(self):
+    def nested_temp_dir(self, tmp_path):
         """Create a nested directory structure for testing"""
-        temp_dir = tempfile.mkdtemp()
-        base_path = Path(temp_dir)
-
-        # Create nested structure
-        (base_path / "level1").mkdir()
-        (base_path / "level1" / "level2").mkdir()
-        (base_path / "level1" / "level2" / "level3").mkdir()
-
-        yield base_path
-        shutil.rmtree(temp_dir)
+        (tmp_path / "level1" / "level2" / "level3").mkdir(parents=True)
+        return tmp_path
 
     def test_output_paths_preserve_structure_with_base_dir(self, nested_temp_dir):
         """Test that output paths preserve folder structure when base_input_path is set"""
@@ -389,25 +751,13 @@ class TestFolderStructurePreservation:
         assert md_path == output_dir / "test.md"
         assert json_path == output_dir / "test.json"
 
-    @patch("src.converter.Document")
-    def test_convert_preserves_nested_structure(self, mock_document_class, nested_temp_dir):
+    def test_convert_preserves_nested_structure(self, nested_temp_dir):
         """Test that actual conversion preserves nested directory structure"""
         output_dir = nested_temp_dir / "output"
         converter = DocumentConverter(output_dir=output_dir, base_input_path=nested_temp_dir)
 
-        # Setup mock document
-        mock_doc = Mock()
-        mock_document_class.return_value = mock_doc
-        mock_doc.paragraphs = []
-        mock_doc.core_properties.author = ""
-        mock_doc.core_properties.title = ""
-        mock_doc.core_properties.created = None
-        mock_doc.core_properties.modified = None
-
         # Create test file in nested directory
-        test_file = nested_temp_dir / "level1" / "level2" / "level3" / "deep.docx"
-        test_file.parent.mkdir(parents=True, exist_ok=True)
-        test_file.touch()
+        test_file = make_docx(nested_temp_dir / "level1" / "level2" / "level3" / "deep.docx")
 
         # Convert
         result = converter.convert_docx(test_file)
@@ -427,6 +777,17 @@ class TestFolderStructurePreservation:
         assert (output_dir / "level1" / "level2").is_dir()
         assert (output_dir / "level1" / "level2" / "level3").is_dir()
 
+    def test_output_paths_relative_base_dir(self, nested_temp_dir, monkeypatch):
+        """Test a relative base path matches absolute input paths under it"""
+        monkeypatch.chdir(nested_temp_dir)
+        output_dir = nested_temp_dir / "output"
+        converter = DocumentConverter(output_dir=output_dir, base_input_path=Path("level1"))
+
+        md_path, json_path = converter._get_output_paths(nested_temp_dir / "level1" / "level2" / "test.pdf")
+
+        assert md_path == output_dir / "md" / "level2" / "test.md"
+        assert json_path == output_dir / "json" / "level2" / "test.json"
+
     def test_files_outside_base_path_use_flat_structure(self, nested_temp_dir):
         """Test files outside base path fall back to flat structure"""
         output_dir = nested_temp_dir / "output"
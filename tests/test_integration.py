@@ -1,5 +1,3 @@
-import shutil
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -17,13 +15,6 @@ class TestIntegration:
         """Create a CLI runner"""
         return CliRunner()
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests"""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
     def create_mock_pdf(self, path: Path):
         """Create a mock PDF file"""
         path.write_bytes(b"%PDF-1.4\n%Fake PDF content")
@@ -45,10 +36,10 @@ class TestIntegration:
             zf.writestr("[Content_Types].xml", '<?xml version="1.0"?>')
 
     @patch("src.converter.DocumentConverter.convert_pdf")
-    def test_cli_single_file(self, mock_convert_pdf, runner, temp_dir):
+    def test_cli_single_file(self, mock_convert_pdf, runner, tmp_path):
         """Test CLI with single file"""
         # Create test PDF
-        test_pdf = temp_dir / "test.pdf"
+        test_pdf = tmp_path / "test.pdf"
         self.create_mock_pdf(test_pdf)
 
         # Mock conversion
@@ -56,8 +47,8 @@ class TestIntegration:
 
         mock_convert_pdf.return_value = ConversionResult(
             source_path=str(test_pdf),
-            markdown_path=str(temp_dir / "test.md"),
-            json_path=str(temp_dir / "test.json"),
+            markdown_path=str(tmp_path / "test.md"),
+            json_path=str(tmp_path / "test.json"),
             status="success",
         )
 
@@ -65,55 +56,55 @@ class TestIntegration:
         result = runner.invoke(main, [str(test_pdf)])
 
         assert result.exit_code == 0
-        assert "Found 1 documents to convert" in result.output
+        assert "Processed 1 documents" in result.output
         assert mock_convert_pdf.called
 
     @patch("src.converter.DocumentConverter.convert_pdf")
     @patch("src.converter.DocumentConverter.convert_docx")
     @patch("src.converter.DocumentConverter.convert_pptx")
-    def test_cli_directory(self, mock_pptx, mock_docx, mock_pdf, runner, temp_dir):
+    def test_cli_directory(self, mock_pptx, mock_docx, mock_pdf, runner, tmp_path):
         """Test CLI with directory"""
         # Create test files
-        self.create_mock_pdf(temp_dir / "doc1.pdf")
-        self.create_mock_docx(temp_dir / "doc2.docx")
-        self.create_mock_pptx(temp_dir / "doc3.pptx")
+        self.create_mock_pdf(tmp_path / "doc1.pdf")
+        self.create_mock_docx(tmp_path / "doc2.docx")
+        self.create_mock_pptx(tmp_path / "doc3.pptx")
 
         # Mock conversions
         from src.converter import ConversionResult
 
         mock_pdf.return_value = ConversionResult(
-            source_path=str(temp_dir / "doc1.pdf"),
-            markdown_path=str(temp_dir / "doc1.md"),
-            json_path=str(temp_dir / "doc1.json"),
+            source_path=str(tmp_path / "doc1.pdf"),
+            markdown_path=str(tmp_path / "doc1.md"),
+            json_path=str(tmp_path / "doc1.json"),
             status="success",
         )
         mock_docx.return_value = ConversionResult(
-            source_path=str(temp_dir / "doc2.docx"),
-            markdown_path=str(temp_dir / "doc2.md"),
-            json_path=str(temp_dir / "doc2.json"),
+            source_path=str(tmp_path / "doc2.docx"),
+            markdown_path=str(tmp_path / "doc2.md"),
+            json_path=str(tmp_path / "doc2.json"),
             status="success",
         )
         mock_pptx.return_value = ConversionResult(
-            source_path=str(temp_dir / "doc3.pptx"),
-            markdown_path=str(temp_dir / "doc3.md"),
-            json_path=str(temp_dir / "doc3.json"),
+            source_path=str(tmp_path / "doc3.pptx"),
+            markdown_path=str(tmp_path / "doc3.md"),
+            json_path=str(tmp_path / "doc3.json"),
             status="success",
         )
 
-        # Run CLI
-        result = runner.invoke(main, [str(temp_dir)])
+        # Run CLI (serially, mocks are not visible inside worker processes)
+        result = runner.invoke(main, [str(tmp_path), "--no-parallel"])
 
         assert result.exit_code == 0
-        assert "Found 3 documents to convert" in result.output
+        assert "Processed 3 documents" in result.output
 
     @patch("src.converter.DocumentConverter.convert_pdf")
-    def test_cli_with_output_dir(self, mock_convert_pdf, runner, temp_dir):
+    def test_cli_with_output_dir(self, mock_convert_pdf, runner, tmp_path):
         """Test CLI with output directory option"""
         # Create test PDF
-        test_pdf = temp_dir / "test.pdf"
+        test_pdf = tmp_path / "test.pdf"
         self.create_mock_pdf(test_pdf)
 
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         # Mock conversion
         from src.converter import ConversionResult
@@ -131,10 +122,10 @@ class TestIntegration:
         assert result.exit_code == 0
 
     @patch("src.converter.DocumentConverter.convert_pdf")
-    def test_cli_with_summary(self, mock_convert_pdf, runner, temp_dir):
+    def test_cli_with_summary(self, mock_convert_pdf, runner, tmp_path):
         """Test CLI with summary option"""
         # Create test PDF
-        test_pdf = temp_dir / "test.pdf"
+        test_pdf = tmp_path / "test.pdf"
         self.create_mock_pdf(test_pdf)
 
         # Mock conversion
@@ -142,8 +133,8 @@ class TestIntegration:
 
         mock_convert_pdf.return_value = ConversionResult(
             source_path=str(test_pdf),
-            markdown_path=str(temp_dir / "test.md"),
-            json_path=str(temp_dir / "test.json"),
+            markdown_path=str(tmp_path / "test.md"),
+            json_path=str(tmp_path / "test.json"),
             status="success",
         )
 
@@ -154,21 +145,21 @@ class TestIntegration:
         assert "Conversion Summary" in result.output
         assert "Total: 1 | Success: 1 | Failed: 0" in result.output
 
-    def test_cli_no_documents_found(self, runner, temp_dir):
+    def test_cli_no_documents_found(self, runner, tmp_path):
         """Test CLI when no documents are found"""
         # Create directory with no supported files
-        (temp_dir / "test.txt").touch()
+        (tmp_path / "test.txt").touch()
 
-        result = runner.invoke(main, [str(temp_dir)])
+        result = runner.invoke(main, [str(tmp_path)])
 
         assert result.exit_code == 0
         assert "No supported documents found" in result.output
 
     @patch("src.converter.DocumentConverter.convert_pdf")
-    def test_cli_with_error(self, mock_convert_pdf, runner, temp_dir):
+    def test_cli_with_error(self, mock_convert_pdf, runner, tmp_path):
         """Test CLI handling conversion errors"""
         # Create test PDF
-        test_pdf = temp_dir / "test.pdf"
+        test_pdf = tmp_path / "test.pdf"
         self.create_mock_pdf(test_pdf)
 
         # Mock conversion failure
@@ -196,25 +187,25 @@ class TestIntegration:
         assert "--summary" in result.output
 
     @patch("src.converter.DocumentConverter.convert_docx")
-    def test_cli_preserves_folder_structure(self, mock_convert_docx, runner, temp_dir):
+    def test_cli_preserves_folder_structure(self, mock_convert_docx, runner, tmp_path):
         """Test that CLI preserves folder structure when converting directories"""
         # Create nested directory structure
-        (temp_dir / "sub1").mkdir()
-        (temp_dir / "sub1" / "sub2").mkdir()
+        (tmp_path / "sub1").mkdir()
+        (tmp_path / "sub1" / "sub2").mkdir()
 
         # Create files at different levels
-        self.create_mock_docx(temp_dir / "root.docx")
-        self.create_mock_docx(temp_dir / "sub1" / "level1.docx")
-        self.create_mock_docx(temp_dir / "sub1" / "sub2" / "level2.docx")
+        self.create_mock_docx(tmp_path / "root.docx")
+        self.create_mock_docx(tmp_path / "sub1" / "level1.docx")
+        self.create_mock_docx(tmp_path / "sub1" / "sub2" / "level2.docx")
 
-        output_dir = temp_dir / "output"
+        output_dir = tmp_path / "output"
 
         # Mock conversions
         from src.converter import ConversionResult
 
         def mock_convert_side_effect(path):
             # Generate output paths that should preserve structure
-            rel_path = path.relative_to(temp_dir)
+            rel_path = path.relative_to(tmp_path)
             out_base = output_dir / rel_path.parent / path.stem
             return ConversionResult(
                 source_path=str(path),
@@ -226,16 +217,17 @@ class TestIntegration:
         mock_convert_docx.side_effect = mock_convert_side_effect
 
         # Run CLI with output directory
-        result = runner.invoke(main, [str(temp_dir), "--output-dir", str(output_dir)])
+        result = runner.invoke(main, [str(tmp_path), "--output-dir", str(output_dir), "--no-parallel"])
 
         assert result.exit_code == 0
-        assert "Found 3 documents to convert" in result.output
+        assert "Processed 3 documents" in result.output
 
         # Verify the converter was called with correct base_input_path
         assert mock_convert_docx.call_count == 3
 
         # Verify all files were processed
-        # The CLI output shows file paths being processed
-        assert "root.docx" in result.output
-        assert "level1.docx" in result.output
-        assert "level2.docx" in result.output or "sub2" in result.output
+        # The CLI output shows file paths being processed; Rich folds long paths at the console width
+        output = result.output.replace("\n", "")
+        assert "root.docx" in output
+        assert "level1.docx" in output
+        assert "level2.docx" in output or "sub2" in output
@@ -1,43 +1,93 @@
 """Tests for OCR functionality"""
 
-import shutil
-import tempfile
+import concurrent.futures
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from PIL import Image
 
+from src import render as render_module
 from src.ocr import (
+    NativeTextPlugin,
     OCRManager,
     OCRPlugin,
     SuryaOCRPlugin,
     SuryaOCRProcessor,
+    _configure_cpu_threads,
+    _cpu_supports_bf16,
+    _reading_order,
 )
 
+# Passed as the device so constructors neither query CUDA nor create torch devices; not "cpu", so
+# loading models also leaves torch's thread settings alone
+MOCK_DEVICE = SimpleNamespace(type="mock")
+
+# Specced once: building a Mock with spec=Image.Image introspects the whole class. Tests only pass it around.
+_IMAGE_MOCK_SPEC = Mock(spec=Image.Image)
+
+
+@pytest.fixture(scope="module")
+def processor():
+    """Create a processor instance shared by the module"""
+    return SuryaOCRProcessor(MOCK_DEVICE)
+
+
+@pytest.fixture(scope="module")
+def plugin():
+    """Create a plugin instance shared by the module"""
+    return SuryaOCRPlugin(MOCK_DEVICE)
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """Create a manager instance shared by the module"""
+    return OCRManager(MOCK_DEVICE)
+
+
+@pytest.fixture
+def surya_predictors(monkeypatch) -> SimpleNamespace:
+    """Replace the Surya predictor classes and torch.compile in one pass"""
+    mocks = SimpleNamespace(detection=MagicMock(), recognition=MagicMock(), compile=MagicMock())
+    monkeypatch.setattr("src.ocr.DetectionPredictor", mocks.detection)
+    monkeypatch.setattr("src.ocr.RecognitionPredictor", mocks.recognition)
+    monkeypatch.setattr("src.ocr.torch.compile", mocks.compile)
+    return mocks
+
+
+@pytest.fixture
+def page_rendering(monkeypatch) -> SimpleNamespace:
+    """Replace the PyMuPDF matrix and PIL image construction used to rasterize pages"""
+    mocks = SimpleNamespace(matrix=MagicMock(), frombytes=MagicMock())
+    monkeypatch.setattr("fitz.Matrix", mocks.matrix)
+    monkeypatch.setattr("PIL.Image.frombytes", mocks.frombytes)
+    return mocks
+
+
+def reset_processor_state(processor: SuryaOCRProcessor):
+    """Drop predictors a test loaded or assigned"""
+    processor._models_loaded = False
+    processor.detection_predictor = None
+    processor.recognition_predictor = None
+
 
 class TestSuryaOCRProcessor:
     """Test suite for SuryaOCRProcessor"""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests"""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
-    @pytest.fixture
-    def processor(self):
-        """Create a processor instance"""
-        with patch("torch.device"):
-            return SuryaOCRProcessor()
+    @pytest.fixture(autouse=True)
+    def reset_processor(self, processor):
+        """Undo per-test changes to the shared processor"""
+        settings = (processor.render_workers, processor.detect_batch)
+        yield
+        reset_processor_state(processor)
+        processor.render_workers, processor.detect_batch = settings
 
     @pytest.fixture
-    def mock_pdf_path(self, temp_dir):
-        """Create a mock PDF file"""
-        pdf_path = temp_dir / "test.pdf"
-        pdf_path.touch()
-        return pdf_path
+    def mock_pdf_path(self, tmp_path):
+        """Path of a mock PDF; never created, since fitz and the OCR steps are mocked"""
+        return tmp_path / "test.pdf"
 
     def test_init(self, processor):
         """Test processor initialization"""
@@ -46,27 +96,54 @@ class TestSuryaOCRProcessor:
         assert processor.detection_predictor is None
         assert processor.recognition_predictor is None
 
-    @patch("src.ocr.DetectionPredictor")
-    @patch("src.ocr.RecognitionPredictor")
-    def test_load_models(self, mock_rec_predictor, mock_det_predictor, processor):
+    def test_load_models(self, surya_predictors, processor):
         """Test model loading"""
-        # Mock return values
-        mock_det_predictor.return_value = Mock()
-        mock_rec_predictor.return_value = Mock()
-
         processor._load_models()
 
         assert processor._models_loaded
         assert processor.detection_predictor is not None
         assert processor.recognition_predictor is not None
 
+    def test_load_models_optimized(self, surya_predictors, processor):
+        """Test predictor models are compiled when optimization is opted into"""
+        mock_compile = surya_predictors.compile
+        mock_compile.side_effect = lambda model, **kwargs: ("compiled", model)
+        eager_model = surya_predictors.recognition.return_value.model
+
+        with patch.dict("os.environ", {"DOCS2MD_OCR_OPTIMIZE": "1"}):
+            processor._load_models()
+
+        assert processor.recognition_predictor.model == ("compiled", eager_model)
+        assert mock_compile.call_count == 2
+
+    @pytest.mark.parametrize("processes, expected", [(None, 7), ("2", 3), ("16", 1)])
+    def test_configure_cpu_threads_splits_cores(self, monkeypatch, processes, expected):
+        """Test torch gets all but one core, divided between the converter's worker processes"""
+        set_num_threads = Mock()
+        monkeypatch.setattr("src.ocr.torch.set_num_threads", set_num_threads)
+        monkeypatch.setattr("src.ocr.os.cpu_count", lambda: 8)
+        if processes is None:
+            monkeypatch.delenv("DOCS2MD_CPU_PROCESSES", raising=False)
+        else:
+            monkeypatch.setenv("DOCS2MD_CPU_PROCESSES", processes)
+
+        _configure_cpu_threads()
+
+        set_num_threads.assert_called_once_with(expected)
+
+    def test_cpu_supports_bf16_without_probe(self, monkeypatch):
+        """Test bf16 is not assumed when torch cannot probe the CPU for it"""
+        monkeypatch.setattr("src.ocr.torch.cpu", SimpleNamespace())
+
+        assert _cpu_supports_bf16() is False
+
     @patch("fitz.open")
     def test_is_scanned_pdf_true(self, mock_fitz_open, processor, mock_pdf_path):
         """Test detection of scanned PDF"""
         # Mock PDF document
         mock_doc = MagicMock()
         mock_page = Mock()
-        mock_page.get_text.return_value = "a"  # Very little text
+        mock_page.get_text.return_value = [(0, 0, 10, 10, "a", 0, 0)]  # Very little text
         mock_page.get_images.return_value = [Mock(), Mock()]  # Multiple images
         mock_doc.__len__ = Mock(return_value=1)
         mock_doc.__getitem__ = Mock(return_value=mock_page)
@@ -83,7 +160,10 @@ class TestSuryaOCRProcessor:
         # Mock PDF document
         mock_doc = MagicMock()
         mock_page = Mock()
-        mock_page.get_text.return_value = "This is a lot of text content that indicates a text-based PDF document"
+        mock_page.get_text.return_value = [
+            (0, 0, 100, 10, "This is a lot of text content that indicates a text-based PDF document", 0, 0),
+            (0, 10, 100, 20, "spread over a few blocks so the sampled page clearly carries a text layer", 1, 0),
+        ]
         mock_page.get_images.return_value = []  # No images
         mock_doc.__len__ = Mock(return_value=1)
         mock_doc.__getitem__ = Mock(return_value=mock_page)
@@ -94,6 +174,23 @@ class TestSuryaOCRProcessor:
         assert result is False
         mock_doc.close.assert_called_once()
 
+    @patch("fitz.open")
+    def test_is_scanned_pdf_stops_early_for_digital(self, mock_fitz_open, processor, mock_pdf_path):
+        """Test sampling stops once the text budget for all sampled pages is reached"""
+        mock_doc = MagicMock()
+        mock_page = Mock()
+        mock_page.get_text.return_value = [(0, 0, 100, 100, "x" * 400, 0, 0)]
+        mock_page.get_images.return_value = [Mock()]
+        mock_doc.__len__ = Mock(return_value=10)
+        mock_doc.__getitem__ = Mock(return_value=mock_page)
+        mock_fitz_open.return_value = mock_doc
+
+        result = processor.is_scanned_pdf(mock_pdf_path)
+
+        assert result is False
+        mock_page.get_text.assert_called_once_with("blocks")
+        mock_page.get_images.assert_not_called()
+
     @patch("fitz.open")
     def test_is_scanned_pdf_error_handling(self, mock_fitz_open, processor, mock_pdf_path):
         """Test error handling in PDF detection"""
@@ -104,46 +201,135 @@ class TestSuryaOCRProcessor:
         assert result is False
 
     @patch("fitz.open")
-    @patch("io.BytesIO")
-    @patch("PIL.Image.open")
-    def test_extract_images_from_pdf(self, mock_pil_open, mock_bytesio, mock_fitz_open, processor, mock_pdf_path):
+    def test_open_and_classify_keeps_document_open(self, mock_fitz_open, processor, mock_pdf_path):
+        """Test classification returns the open document for reuse"""
+        mock_doc = MagicMock()
+        mock_page = Mock()
+        mock_page.get_text.return_value = [(0, 0, 100, 100, "<image: DeviceRGB>", 0, 1)]
+        mock_page.get_images.return_value = [Mock()]
+        mock_doc.__len__ = Mock(return_value=1)
+        mock_doc.__getitem__ = Mock(return_value=mock_page)
+        mock_fitz_open.return_value = mock_doc
+
+        doc, is_scanned = processor.open_and_classify(mock_pdf_path)
+
+        assert doc is mock_doc
+        assert is_scanned is True
+        mock_fitz_open.assert_called_once()
+        mock_doc.close.assert_not_called()
+
+    def test_extract_images_from_pdf(self, page_rendering, processor):
         """Test image extraction from PDF"""
+        mock_frombytes = page_rendering.frombytes
         # Mock PDF document
         mock_doc = MagicMock()
         mock_page = Mock()
         mock_pixmap = Mock()
-        mock_pixmap.tobytes.return_value = b"mock_image_data"
+        mock_pixmap.width = 20
+        mock_pixmap.height = 10
+        mock_pixmap.samples = b"\x00" * 20 * 10 * 3
         mock_page.get_pixmap.return_value = mock_pixmap
+        mock_page.rect.height = 792
         mock_doc.__len__ = Mock(return_value=2)
         mock_doc.__getitem__ = Mock(return_value=mock_page)
-        mock_fitz_open.return_value = mock_doc
 
         # Mock PIL Image
-        mock_image = Mock(spec=Image.Image)
-        mock_pil_open.return_value = mock_image
+        mock_frombytes.return_value = _IMAGE_MOCK_SPEC
 
-        result = processor.extract_images_from_pdf(mock_pdf_path)
+        result = processor.extract_images_from_pdf(mock_doc)
 
         assert len(result) == 2
         assert all(isinstance(img, Mock) for img in result)
-        mock_doc.close.assert_called_once()
+        mock_frombytes.assert_called_with("RGB", (20, 10), mock_pixmap.samples)
+        mock_pixmap.tobytes.assert_not_called()
+        # The caller owns the document
+        mock_doc.close.assert_not_called()
+
+    def test_iter_page_images_adaptive_zoom(self, page_rendering, processor):
+        """Test render zoom targets the configured height and is capped at 2x"""
+        small_page = Mock()
+        small_page.rect.height = 200
+        letter_page = Mock()
+        letter_page.rect.height = 800
+        mock_doc = MagicMock()
+        mock_doc.__len__ = Mock(return_value=3)
+        mock_doc.__getitem__ = Mock(side_effect=[letter_page, small_page, letter_page])
 
-    @patch("fitz.open")
-    def test_extract_images_from_pdf_error(self, mock_fitz_open, processor, mock_pdf_path):
+        list(processor.iter_page_images(mock_doc))
+
+        # One matrix per distinct zoom level: 1200 / 800 and the 2x cap
+        assert [c.args for c in page_rendering.matrix.call_args_list] == [(1.5, 1.5), (2.0, 2.0)]
+
+    @patch.object(SuryaOCRProcessor, "_iter_page_images_parallel")
+    def test_iter_page_images_uses_render_workers(self, mock_parallel, processor):
+        """Test file-backed documents are rendered in worker processes when configured"""
+        mock_parallel.return_value = iter(["page1", "page2"])
+        processor.render_workers = 4
+        mock_doc = MagicMock()
+        mock_doc.__len__ = Mock(return_value=2)
+        mock_doc.name = "/tmp/scan.pdf"
+        mock_doc.needs_pass = False
+
+        assert list(processor.iter_page_images(mock_doc)) == ["page1", "page2"]
+        # Never more workers than pages
+        mock_parallel.assert_called_once_with("/tmp/scan.pdf", 2, 2)
+
+    def test_iter_page_images_parallel_reuses_workers(self, monkeypatch, page_rendering, processor):
+        """Test one spawned worker pool renders every PDF, opening each PDF once, until the processor is closed"""
+        pools = []
+        finalizers = []
+
+        def thread_pool(max_workers, mp_context, initializer):
+            pools.append(mp_context.get_start_method())
+            return concurrent.futures.ThreadPoolExecutor(1, initializer=initializer)
+
+        mock_page = Mock()
+        mock_page.rect.height = 600
+        mock_page.get_pixmap.return_value = SimpleNamespace(width=20, height=10, samples=b"rgb")
+        docs = {path: MagicMock(__getitem__=Mock(return_value=mock_page)) for path in ("/tmp/a.pdf", "/tmp/b.pdf")}
+        mock_open = Mock(side_effect=docs.get)
+        monkeypatch.setattr(render_module, "_RENDER_DOC", None)
+        monkeypatch.setattr(render_module, "_RENDER_PATH", None)
+        monkeypatch.setattr("fitz.open", mock_open)
+        monkeypatch.setattr("src.ocr.concurrent.futures.ProcessPoolExecutor", thread_pool)
+        monkeypatch.setattr(
+            "src.render.multiprocessing.util.Finalize", lambda obj, callback, **kwargs: finalizers.append(callback)
+        )
+
+        assert len(list(processor._iter_page_images_parallel("/tmp/a.pdf", 3, 2))) == 3
+        assert len(list(processor._iter_page_images_parallel("/tmp/b.pdf", 2, 2))) == 2
+        processor.close()
+        for finalizer in finalizers:
+            finalizer()
+
+        assert pools == ["spawn"]
+        assert [call.args for call in mock_open.call_args_list] == [("/tmp/a.pdf",), ("/tmp/b.pdf",)]
+        # The previous PDF is closed when the worker moves on, the last one when the worker exits
+        docs["/tmp/a.pdf"].close.assert_called_once()
+        docs["/tmp/b.pdf"].close.assert_called_once()
+        assert processor._render_pool is None
+
+    def test_reading_order(self):
+        """Test text lines are ordered by y, then x, keeping ties stable"""
+        lines = [Mock(bbox=bbox) for bbox in ([50, 20, 90, 30], [0, 20, 40, 30], [0, 0, 40, 10], [50, 20, 60, 30])]
+
+        assert _reading_order(lines) == [lines[2], lines[1], lines[0], lines[3]]
+
+    def test_extract_images_from_pdf_error(self, processor):
         """Test error handling in image extraction"""
-        mock_fitz_open.side_effect = Exception("PDF error")
+        mock_doc = MagicMock()
+        mock_doc.__len__ = Mock(side_effect=Exception("PDF error"))
 
-        result = processor.extract_images_from_pdf(mock_pdf_path)
+        result = processor.extract_images_from_pdf(mock_doc)
 
         assert result == []
 
-    @patch.object(SuryaOCRProcessor, "_load_models")
-    @patch.object(SuryaOCRProcessor, "extract_images_from_pdf")
-    def test_process_with_ocr(self, mock_extract_images, mock_load_models, processor, mock_pdf_path):
+    def test_process_with_ocr(self, monkeypatch, processor, mock_pdf_path):
         """Test OCR processing"""
         # Mock images
-        mock_images = [Mock(spec=Image.Image), Mock(spec=Image.Image)]
-        mock_extract_images.return_value = mock_images
+        mock_images = [_IMAGE_MOCK_SPEC, _IMAGE_MOCK_SPEC]
+        monkeypatch.setattr(SuryaOCRProcessor, "_load_models", Mock())
+        monkeypatch.setattr(SuryaOCRProcessor, "iter_page_images", Mock(return_value=iter(mock_images)))
 
         # Mock OCR predictions
         mock_line1 = Mock()
@@ -160,9 +346,14 @@ class TestSuryaOCRProcessor:
         # Mock recognition predictor
         processor.recognition_predictor = Mock()
         processor.recognition_predictor.return_value = [mock_prediction, mock_prediction]
-        processor.detection_predictor = Mock()
+        mock_box = Mock()
+        mock_box.polygon = [[0, 0], [100, 0], [100, 20], [0, 20]]
+        mock_detection = Mock()
+        mock_detection.bboxes = [mock_box]
+        processor.detection_predictor = Mock(side_effect=lambda images: [mock_detection] * len(images))
 
-        result_text, metadata = processor.process_with_ocr(mock_pdf_path, ["en"])
+        mock_doc = MagicMock()
+        result_text, metadata = processor.process_with_ocr(mock_pdf_path, ["en"], doc=mock_doc)
 
         assert "## Page 1" in result_text
         assert "## Page 2" in result_text
@@ -172,13 +363,81 @@ class TestSuryaOCRProcessor:
         assert metadata["ocr_engine"] == "surya"
         assert metadata["languages"] == ["en"]
         assert metadata["page_count"] == 2
+        # Detection ran once for both pages upstream, recognition reused its polygons
+        assert processor.detection_predictor.call_count == 1
+        assert "polygons" in processor.recognition_predictor.call_args.kwargs
+        mock_doc.close.assert_called_once()
+
+    def test_run_ocr_stages_batches_detection(self, processor):
+        """Test detection takes up to detect_batch pages per call and flushes the rest at the document end"""
+        processor.detect_batch = 2
+        processor.detection_predictor = Mock(
+            side_effect=lambda images: [SimpleNamespace(bboxes=[SimpleNamespace(polygon=img)]) for img in images]
+        )
+        processor.recognition_predictor = Mock(side_effect=lambda images, **kwargs: [f"pred-{img}" for img in images])
+
+        predictions = processor._run_ocr_stages(f"p{i}" for i in range(5))
+
+        assert predictions == ["pred-p0", "pred-p1", "pred-p2", "pred-p3", "pred-p4"]
+        calls = processor.detection_predictor.call_args_list
+        assert [call.args[0] for call in calls] == [["p0", "p1"], ["p2", "p3"], ["p4"]]
+        assert processor.recognition_predictor.call_args.kwargs["polygons"] == [["p0"], ["p1"], ["p2"], ["p3"], ["p4"]]
+
+    # 40 pages leave the rasterizer blocked on a full queue; a single page fails on the final batch
+    @pytest.mark.parametrize("page_count", [40, 1])
+    def test_run_ocr_stages_detection_error(self, processor, page_count):
+        """Test a detection failure is raised without leaving a stage blocked"""
+        processor.detect_batch = 2
+        processor.detection_predictor = Mock(side_effect=RuntimeError("detection failed"))
+        processor.recognition_predictor = Mock()
+
+        with pytest.raises(RuntimeError, match="detection failed"):
+            processor._run_ocr_stages(f"p{i}" for i in range(page_count))
+        processor.recognition_predictor.assert_not_called()
+
+    def test_run_ocr_stages_detection_error_stops_rasterizing(self, processor):
+        """Test pages after a detection failure are no longer rendered"""
+        rendered = []
+
+        def pages():
+            for i in range(100):
+                rendered.append(i)
+                yield f"p{i}"
+
+        processor.detect_batch = 2
+        processor.detection_predictor = Mock(side_effect=RuntimeError("detection failed"))
+
+        with pytest.raises(RuntimeError, match="detection failed"):
+            processor._run_ocr_stages(pages())
+        assert len(rendered) < 100
+
+    def test_run_ocr_stages_recognition_error(self, processor):
+        """Test a recognition failure on more pages than the stage queues hold is raised with the stages joined"""
+        processor.detect_batch = 2
+        processor.detection_predictor = Mock(side_effect=lambda images: [SimpleNamespace(bboxes=[]) for _ in images])
+        processor.recognition_predictor = Mock(side_effect=RuntimeError("recognition failed"))
+
+        with pytest.raises(RuntimeError, match="recognition failed"):
+            processor._run_ocr_stages(f"p{i}" for i in range(40))
+        assert not [thread for thread in threading.enumerate() if thread.name.startswith("ocr-")]
+
+    def test_process_with_ocr_closes_document_on_error(self, monkeypatch, processor, mock_pdf_path):
+        """Test a document handed to process_with_ocr is closed when model loading fails"""
+        monkeypatch.setattr(SuryaOCRProcessor, "_load_models", Mock(side_effect=RuntimeError("no models")))
+        mock_doc = MagicMock()
+
+        result_text, metadata = processor.process_with_ocr(mock_pdf_path, doc=mock_doc)
+
+        assert result_text == ""
+        assert "no models" in metadata["error"]
+        mock_doc.close.assert_called_once()
 
-    @patch.object(SuryaOCRProcessor, "extract_images_from_pdf")
-    def test_process_with_ocr_no_images(self, mock_extract_images, processor, mock_pdf_path):
+    @patch.object(SuryaOCRProcessor, "iter_page_images")
+    def test_process_with_ocr_no_images(self, mock_iter_images, processor, mock_pdf_path):
         """Test OCR processing when no images are extracted"""
-        mock_extract_images.return_value = []
+        mock_iter_images.return_value = iter([])
 
-        result_text, metadata = processor.process_with_ocr(mock_pdf_path)
+        result_text, metadata = processor.process_with_ocr(mock_pdf_path, doc=MagicMock())
 
         assert result_text == ""
         assert "error" in metadata
@@ -187,51 +446,71 @@ class TestSuryaOCRProcessor:
 class TestSuryaOCRPlugin:
     """Test suite for SuryaOCRPlugin"""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests"""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+    @pytest.fixture(autouse=True)
+    def reset_plugin(self, plugin):
+        """Undo per-test changes to the shared plugin"""
+        yield
+        plugin.pdf.close()
+        reset_processor_state(plugin.processor)
 
     @pytest.fixture
-    def plugin(self):
-        """Create a plugin instance"""
-        with patch("torch.device"):
-            return SuryaOCRPlugin()
+    def mock_pdf_path(self, tmp_path):
+        """Path of a mock PDF; never created, since fitz and the OCR steps are mocked"""
+        return tmp_path / "test.pdf"
 
     @pytest.fixture
-    def mock_pdf_path(self, temp_dir):
-        """Create a mock PDF file"""
-        pdf_path = temp_dir / "test.pdf"
-        pdf_path.touch()
-        return pdf_path
+    def mock_txt_path(self, tmp_path):
+        """Path of a mock text file; only its suffix is checked"""
+        return tmp_path / "test.txt"
 
-    @pytest.fixture
-    def mock_txt_path(self, temp_dir):
-        """Create a mock text file"""
-        txt_path = temp_dir / "test.txt"
-        txt_path.touch()
-        return txt_path
-
-    @patch.object(SuryaOCRProcessor, "is_scanned_pdf")
-    def test_is_supported_scanned_pdf(self, mock_is_scanned, plugin, mock_pdf_path):
+    @patch.object(SuryaOCRProcessor, "classify")
+    @patch("fitz.open")
+    def test_is_supported_scanned_pdf(self, mock_fitz_open, mock_classify, plugin, mock_pdf_path):
         """Test plugin support for scanned PDF"""
-        mock_is_scanned.return_value = True
+        mock_classify.return_value = True
 
         result = plugin.is_supported(mock_pdf_path)
 
         assert result is True
+        mock_classify.assert_called_once_with(mock_fitz_open.return_value, mock_pdf_path)
+        # Kept open for process
+        mock_fitz_open.return_value.close.assert_not_called()
 
-    @patch.object(SuryaOCRProcessor, "is_scanned_pdf")
-    def test_is_supported_text_pdf(self, mock_is_scanned, plugin, mock_pdf_path):
+    @patch.object(SuryaOCRProcessor, "classify")
+    @patch("fitz.open")
+    def test_is_supported_text_pdf(self, mock_fitz_open, mock_classify, plugin, mock_pdf_path):
         """Test plugin support for text-based PDF"""
-        mock_is_scanned.return_value = False
+        mock_classify.return_value = False
 
         result = plugin.is_supported(mock_pdf_path)
 
         assert result is False
 
+    @patch("fitz.open")
+    def test_is_supported_unreadable_pdf(self, mock_fitz_open, plugin, mock_pdf_path):
+        """Test PDFs that cannot be opened are left to marker"""
+        mock_fitz_open.side_effect = RuntimeError("broken")
+
+        assert plugin.is_supported(mock_pdf_path) is False
+
+    def test_process_reuses_classified_document(self, monkeypatch, plugin, mock_pdf_path):
+        """Test process hands the document opened by is_supported to OCR"""
+        mock_doc = Mock()
+        mock_fitz_open = Mock(return_value=mock_doc)
+        mock_process_ocr = Mock(return_value=("extracted text", {"ocr_used": True}))
+        monkeypatch.setattr("fitz.open", mock_fitz_open)
+        monkeypatch.setattr(SuryaOCRProcessor, "classify", Mock(return_value=True))
+        monkeypatch.setattr(SuryaOCRProcessor, "process_with_ocr", mock_process_ocr)
+
+        assert plugin.is_supported(mock_pdf_path)
+        plugin.process(mock_pdf_path)
+        plugin.pdf.close()
+
+        mock_fitz_open.assert_called_once_with(str(mock_pdf_path))
+        mock_process_ocr.assert_called_once_with(mock_pdf_path, ["en"], doc=mock_doc)
+        # process_with_ocr owns and closes the document it was handed
+        mock_doc.close.assert_not_called()
+
     def test_is_supported_non_pdf(self, plugin, mock_txt_path):
         """Test plugin support for non-PDF file"""
         result = plugin.is_supported(mock_txt_path)
@@ -247,37 +526,80 @@ class TestSuryaOCRPlugin:
 
         assert result_text == "extracted text"
         assert metadata["ocr_used"] is True
-        mock_process_ocr.assert_called_once_with(mock_pdf_path, ["en", "es"])
+        mock_process_ocr.assert_called_once_with(mock_pdf_path, ["en", "es"], doc=None)
 
 
-class TestOCRManager:
-    """Test suite for OCRManager"""
+class TestNativeTextPlugin:
+    """Test suite for NativeTextPlugin"""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests"""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
+    def mock_pdf_path(self, tmp_path):
+        """Path of a mock PDF; never created, since fitz and the OCR steps are mocked"""
+        return tmp_path / "test.pdf"
 
-    @pytest.fixture
-    def manager(self):
-        """Create a manager instance"""
-        with patch("torch.device"):
-            return OCRManager()
+    @staticmethod
+    def _mock_doc(page_texts):
+        mock_doc = MagicMock()
+        pages = []
+        for text in page_texts:
+            page = Mock()
+            page.get_text.return_value = text
+            pages.append(page)
+        mock_doc.__iter__ = Mock(return_value=iter(pages))
+        return mock_doc
+
+    @patch("fitz.open")
+    def test_digital_pdf_uses_text_layer(self, mock_fitz_open, mock_pdf_path):
+        """Test dense text layers are returned without reopening the PDF"""
+        mock_fitz_open.return_value = self._mock_doc(["a" * 500, "b" * 500])
+        plugin = NativeTextPlugin()
+
+        assert plugin.is_supported(mock_pdf_path) is True
+        text, metadata = plugin.process(mock_pdf_path)
+
+        assert text == "a" * 500 + "\n\n" + "b" * 500
+        assert metadata == {"ocr_used": False, "engine": "pymupdf", "page_count": 2}
+        mock_fitz_open.assert_called_once()
+
+    @patch("fitz.open")
+    def test_sparse_pdf_not_supported(self, mock_fitz_open, mock_pdf_path):
+        """Test PDFs with little text are left to OCR or marker"""
+        mock_fitz_open.return_value = self._mock_doc(["short", ""])
+        plugin = NativeTextPlugin()
+
+        assert plugin.is_supported(mock_pdf_path) is False
+
+    def test_non_pdf_not_supported(self, tmp_path):
+        """Test non-PDF files are rejected by suffix"""
+        assert NativeTextPlugin().is_supported(tmp_path / "test.docx") is False
+
+
+class TestOCRManager:
+    """Test suite for OCRManager"""
+
+    @pytest.fixture(autouse=True)
+    def reset_manager(self, manager):
+        """Restore the shared manager's default plugins after each test"""
+        plugins = list(manager.plugins)
+        yield
+        manager.plugins = plugins
 
     @pytest.fixture
-    def mock_pdf_path(self, temp_dir):
-        """Create a mock PDF file"""
-        pdf_path = temp_dir / "test.pdf"
-        pdf_path.touch()
-        return pdf_path
+    def mock_pdf_path(self, tmp_path):
+        """Path of a mock PDF; never created, since fitz and the OCR steps are mocked"""
+        return tmp_path / "test.pdf"
 
     def test_init(self, manager):
         """Test manager initialization"""
         assert len(manager.plugins) == 1
         assert isinstance(manager.plugins[0], SuryaOCRPlugin)
 
+    def test_init_native_text_first(self):
+        """Test the native text plugin is tried before OCR"""
+        manager = OCRManager(MOCK_DEVICE, native_text=True)
+
+        assert [type(plugin) for plugin in manager.plugins] == [NativeTextPlugin, SuryaOCRPlugin]
+
     def test_register_plugin(self, manager):
         """Test plugin registration"""
         mock_plugin = Mock(spec=OCRPlugin)
@@ -287,50 +609,77 @@ class TestOCRManager:
         assert len(manager.plugins) == 2
         assert mock_plugin in manager.plugins
 
-    def test_process_if_needed_supported(self, manager, mock_pdf_path):
-        """Test processing when file is supported"""
+    def test_close_closes_plugins(self, manager):
+        """Test closing the manager releases what each plugin keeps across files"""
         mock_plugin = Mock(spec=OCRPlugin)
-        mock_plugin.is_supported.return_value = True
-        mock_plugin.process.return_value = ("text", {"meta": "data"})
+        manager.register_plugin(mock_plugin)
 
-        manager.plugins = [mock_plugin]
+        with patch.object(manager.plugins[0].processor, "close") as mock_processor_close:
+            manager.close()
 
-        result = manager.process_if_needed(mock_pdf_path)
+        mock_plugin.close.assert_called_once()
+        mock_processor_close.assert_called_once()
 
-        assert result == ("text", {"meta": "data"})
-        mock_plugin.is_supported.assert_called_once_with(mock_pdf_path)
-        mock_plugin.process.assert_called_once_with(mock_pdf_path)
+    @pytest.mark.parametrize(
+        "supports, expected_idx",
+        [([True], 0), ([False], None), ([False, True], 1)],
+        ids=["supported", "not_supported", "multiple_plugins"],
+    )
+    def test_process_if_needed(self, manager, mock_pdf_path, supports, expected_idx):
+        """Test the first plugin supporting the file processes it, and later plugins are not consulted"""
+        plugins = [Mock(spec=OCRPlugin, **{"is_supported.return_value": supported}) for supported in supports]
+        if expected_idx is not None:
+            plugins[expected_idx].process.return_value = ("text", {"meta": "data"})
 
-    def test_process_if_needed_not_supported(self, manager, mock_pdf_path):
-        """Test processing when file is not supported"""
-        mock_plugin = Mock(spec=OCRPlugin)
-        mock_plugin.is_supported.return_value = False
-
-        manager.plugins = [mock_plugin]
+        manager.plugins = plugins
 
         result = manager.process_if_needed(mock_pdf_path)
 
-        assert result is None
-        mock_plugin.is_supported.assert_called_once_with(mock_pdf_path)
-        mock_plugin.process.assert_not_called()
+        if expected_idx is None:
+            assert result is None
+        else:
+            assert result == ("text", {"meta": "data"})
+        for i, plugin in enumerate(plugins):
+            plugin.is_supported.assert_called_once_with(mock_pdf_path)
+            if i == expected_idx:
+                plugin.process.assert_called_once_with(mock_pdf_path)
+            else:
+                plugin.process.assert_not_called()
 
-    def test_process_if_needed_multiple_plugins(self, manager, mock_pdf_path):
-        """Test processing with multiple plugins"""
-        mock_plugin1 = Mock(spec=OCRPlugin)
-        mock_plugin1.is_supported.return_value = False
+    @patch.object(SuryaOCRProcessor, "process_with_ocr")
+    @patch.object(SuryaOCRProcessor, "classify", return_value=True)
+    @patch("fitz.open")
+    def test_default_plugins_share_one_open_document(
+        self, mock_fitz_open, mock_classify, mock_process_ocr, mock_pdf_path
+    ):
+        """Test the native text check and OCR read the same open PDF"""
+        mock_page = Mock()
+        mock_page.get_text.return_value = "short"
+        mock_doc = MagicMock()
+        mock_doc.__iter__ = Mock(return_value=iter([mock_page]))
+        mock_fitz_open.return_value = mock_doc
+        mock_process_ocr.return_value = ("ocr text", {"ocr_used": True})
+        manager = OCRManager(MOCK_DEVICE, native_text=True)
 
-        mock_plugin2 = Mock(spec=OCRPlugin)
-        mock_plugin2.is_supported.return_value = True
-        mock_plugin2.process.return_value = ("text", {"meta": "data"})
+        assert manager.process_if_needed(mock_pdf_path) == ("ocr text", {"ocr_used": True})
 
-        manager.plugins = [mock_plugin1, mock_plugin2]
+        mock_fitz_open.assert_called_once_with(str(mock_pdf_path))
+        mock_classify.assert_called_once_with(mock_doc, mock_pdf_path)
+        mock_process_ocr.assert_called_once_with(mock_pdf_path, ["en"], doc=mock_doc)
+        # Handed over to OCR, so the manager does not close it again
+        mock_doc.close.assert_not_called()
 
-        result = manager.process_if_needed(mock_pdf_path)
+    @patch("fitz.open")
+    def test_unhandled_pdf_is_closed(self, mock_fitz_open, mock_pdf_path):
+        """Test the shared document is closed when no plugin handles the PDF"""
+        mock_doc = MagicMock()
+        mock_doc.__iter__ = Mock(return_value=iter([]))
+        mock_fitz_open.return_value = mock_doc
+        manager = OCRManager(MOCK_DEVICE, enable_ocr=False, native_text=True)
 
-        assert result == ("text", {"meta": "data"})
-        mock_plugin1.is_supported.assert_called_once_with(mock_pdf_path)
-        mock_plugin2.is_supported.assert_called_once_with(mock_pdf_path)
-        mock_plugin2.process.assert_called_once_with(mock_pdf_path)
+        assert manager.process_if_needed(mock_pdf_path) is None
+
+        mock_doc.close.assert_called_once()
 
 
 class MockOCRPlugin(OCRPlugin):
@@ -351,24 +700,16 @@ class MockOCRPlugin(OCRPlugin):
 class TestOCRIntegration:
     """Integration tests for OCR functionality"""
 
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for tests"""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-
-    def test_custom_plugin_registration(self, temp_dir):
+    def test_custom_plugin_registration(self, tmp_path):
         """Test registering and using custom OCR plugin"""
-        with patch("torch.device"):
-            manager = OCRManager()
+        manager = OCRManager(MOCK_DEVICE)
 
         # Create custom plugin
         custom_plugin = MockOCRPlugin(supported=True, result=("custom text", {"custom": True}))
         manager.register_plugin(custom_plugin)
 
         # Test file
-        test_file = temp_dir / "test.pdf"
+        test_file = tmp_path / "test.pdf"
         test_file.touch()
 
         # Process should use the first plugin that supports the file